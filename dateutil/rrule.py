@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from calendar import isleap
 from dataclasses import dataclass
-from datetime import datetime, timedelta, date
-from typing import Iterable, List, Optional, Sequence
+from datetime import MAXYEAR, datetime, timedelta, date
+from heapq import merge
+from typing import Iterable, Iterator, List, Optional, Sequence
 
 MINUTELY = "minutely"
 HOURLY = "hourly"
@@ -14,6 +16,8 @@ YEARLY = "yearly"
 
 @dataclass(frozen=True)
 class Weekday:
+    __slots__ = ("weekday",)
+
     weekday: int
 
 
@@ -38,12 +42,13 @@ def _normalize_weekdays(values: Optional[Sequence[Weekday | int]]) -> Optional[L
     return normalized
 
 
+_MDAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def _last_day_of_month(year: int, month: int) -> int:
-    if month == 12:
-        next_month = date(year + 1, 1, 1)
-    else:
-        next_month = date(year, month + 1, 1)
-    return (next_month - timedelta(days=1)).day
+    if month == 2 and isleap(year):
+        return 29
+    return _MDAYS[month - 1]
 
 
 def _add_months(year: int, month: int, months: int) -> tuple[int, int]:
@@ -57,7 +62,103 @@ def _week_start(d: date) -> date:
     return d - timedelta(days=d.weekday())
 
 
+_FREQ_DISPATCH = {
+    MINUTELY: "_after_minutely",
+    HOURLY: "_after_hourly",
+    DAILY: "_after_daily",
+    WEEKLY: "_after_weekly",
+    MONTHLY: "_after_monthly",
+    YEARLY: "_after_yearly",
+}
+
+_MICROSECOND = timedelta(microseconds=1)
+_PERIOD_SECONDS = {MINUTELY: 60, HOURLY: 3600, DAILY: 86400}
+
+
+def _next_period_index(elapsed_us: int, step_us: int, inclusive: bool) -> int:
+    # Integer kernel of the fixed-period frequencies: index n of the first
+    # dtstart + n * step strictly after elapsed_us (or at it when inclusive).
+    if elapsed_us < 0:
+        return 0
+    n, rem = divmod(elapsed_us, step_us)
+    if rem or not inclusive:
+        n += 1
+    return n
+
+
+def _instant(dt: datetime) -> datetime:
+    # dt as a naive UTC datetime, for comparisons that must honour fold.
+    offset = dt.utcoffset()
+    return dt.replace(tzinfo=None) - offset if offset is not None else dt
+
+
+def _past_target(candidate: datetime, target: datetime, inclusive: bool) -> Optional[datetime]:
+    # candidate if it comes after target (or at it when inclusive), else None.
+    # Same-zone datetimes compare by wall clock and ignore fold, which is only
+    # wrong when target lies in the second pass of a repeated fall-back hour:
+    # then instants are compared, and a wall time already passed at fold=0 is
+    # still ahead at fold=1.
+    if not target.fold:
+        return candidate if candidate > target or (inclusive and candidate == target) else None
+    target_instant = _instant(target)
+    for value in (candidate, candidate.replace(fold=1)):
+        instant = _instant(value)
+        if instant > target_instant or (inclusive and instant == target_instant):
+            return value
+    return None
+
+
+def _normalize_times(
+    byhour: Optional[int | Sequence[int]], byminute: Optional[int | Sequence[int]]
+) -> tuple:
+    # Times of day as sorted (hour, minute) pairs: the product of byhour and
+    # byminute, each defaulting to 0 like the midnight bases they replace.
+    hours = [byhour] if isinstance(byhour, int) else sorted(set(byhour or [0]))
+    minutes = [byminute] if isinstance(byminute, int) else sorted(set(byminute or [0]))
+    return tuple((hour, minute) for hour in hours for minute in minutes)
+
+
+def _weekday_skip_table(allowed: Optional[frozenset], interval: int) -> Optional[tuple]:
+    # For each weekday, how many interval-day steps it takes to land on an
+    # allowed weekday (None when the interval never reaches one). Weekdays
+    # repeat every 7 steps, so 7 tries are enough.
+    if allowed is None:
+        return None
+    table = []
+    for weekday in range(7):
+        for steps in range(7):
+            if (weekday + steps * interval) % 7 in allowed:
+                table.append(steps)
+                break
+        else:
+            table.append(None)
+    return tuple(table)
+
+
 class rrule:
+    __slots__ = (
+        "freq",
+        "interval",
+        "dtstart",
+        "bymonth",
+        "byweekday",
+        "bymonthday",
+        "bysetpos",
+        "byhour",
+        "byminute",
+        "_bymonth_set",
+        "_byweekday_set",
+        "_year_months",
+        "_week_days",
+        "_monthdays",
+        "_monthday_last",
+        "_step",
+        "_step_us",
+        "_daily_skip",
+        "_times",
+        "_after_impl",
+    )
+
     def __init__(
         self,
         *,
@@ -68,155 +169,246 @@ class rrule:
         byweekday: Optional[Sequence[Weekday | int]] = None,
         bymonthday: Optional[Sequence[int]] = None,
         bysetpos: Optional[Sequence[int]] = None,
-        byhour: Optional[int] = None,
-        byminute: Optional[int] = None,
+        byhour: Optional[int | Sequence[int]] = None,
+        byminute: Optional[int | Sequence[int]] = None,
     ) -> None:
+        if freq not in _FREQ_DISPATCH:
+            raise ValueError(f"Unsupported frequency: {freq}")
         self.freq = freq
         self.interval = interval
         self.dtstart = dtstart.replace(second=0, microsecond=0)
         self.bymonth = list(bymonth) if bymonth else None
+        self._bymonth_set = frozenset(self.bymonth) if self.bymonth else None
+        self._year_months = sorted(self._bymonth_set) if self._bymonth_set else [self.dtstart.month]
         self.byweekday = _normalize_weekdays(byweekday)
+        self._byweekday_set = frozenset(self.byweekday) if self.byweekday else None
+        self._week_days = tuple(sorted(set(self.byweekday or [self.dtstart.weekday()])))
         self.bymonthday = list(bymonthday) if bymonthday else None
+        # Month days are kept sorted so candidates come out in order; -1 (the
+        # last day) always sorts after every valid positive day.
+        monthdays = set(self.bymonthday or ())
+        self._monthdays = tuple(sorted(day for day in monthdays if day >= 1))
+        self._monthday_last = -1 in monthdays
         self.bysetpos = list(bysetpos) if bysetpos else None
+        # byhour/byminute may be sequences; several times of day are only
+        # expanded from DAILY up (MINUTELY and HOURLY step from dtstart).
         self.byhour = byhour
         self.byminute = byminute
-
-    def after(self, dt: datetime, inc: bool = False) -> Optional[datetime]:
+        self._times = _normalize_times(byhour, byminute)
+        period = _PERIOD_SECONDS.get(freq)
+        self._step = timedelta(seconds=period * interval) if period else None
+        self._step_us = self._step // _MICROSECOND if period else None
+        self._daily_skip = _weekday_skip_table(self._byweekday_set, interval) if freq == DAILY else None
+        self._after_impl = getattr(self, _FREQ_DISPATCH[freq])
+
+    def after(
+        self, dt: datetime, inc: bool = False, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        # upper_bound lets a caller that already holds a candidate ask only for
+        # something that can beat it: None is returned as soon as the search
+        # moves past the bound.
+        # Candidates are stepped in dtstart's wall clock, so target and
+        # upper_bound are read in dtstart's zone too: mixing wall-clock steps
+        # with elapsed time measured across zones lands wrong around DST.
+        tzinfo = self.dtstart.tzinfo
         target = dt
+        if tzinfo is not None and target.tzinfo is not tzinfo:
+            target = target.astimezone(tzinfo)
         inclusive = inc
-        if self.freq == MINUTELY:
-            return self._after_minutely(target, inclusive)
-        if self.freq == HOURLY:
-            return self._after_hourly(target, inclusive)
-        if self.freq == DAILY:
-            return self._after_daily(target, inclusive)
-        if self.freq == WEEKLY:
-            return self._after_weekly(target, inclusive)
-        if self.freq == MONTHLY:
-            return self._after_monthly(target, inclusive)
-        if self.freq == YEARLY:
-            return self._after_yearly(target, inclusive)
-        raise ValueError(f"Unsupported frequency: {self.freq}")
-
-    def _time_for(self, base: datetime) -> datetime:
-        hour = self.byhour if self.byhour is not None else base.hour
-        minute = self.byminute if self.byminute is not None else base.minute
-        return base.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-    def _after_minutely(self, target: datetime, inclusive: bool) -> Optional[datetime]:
-        step = timedelta(minutes=self.interval)
-        candidate = self.dtstart
-        while candidate < target or (not inclusive and candidate == target):
-            candidate += step
-        return candidate
-
-    def _after_hourly(self, target: datetime, inclusive: bool) -> Optional[datetime]:
-        step = timedelta(hours=self.interval)
-        candidate = self.dtstart
-        while candidate < target or (not inclusive and candidate == target):
-            candidate += step
+        if upper_bound is not None:
+            if tzinfo is not None and upper_bound.tzinfo is not tzinfo:
+                upper_bound = upper_bound.astimezone(tzinfo)
+            if upper_bound <= target:
+                return None
+        return self._after_impl(target, inclusive, upper_bound)
+
+    def xafter(self, dt: datetime, count: Optional[int] = None, inc: bool = False) -> Iterator[datetime]:
+        # Successive occurrences after dt; each step resumes from the last
+        # value instead of searching again from dt.
+        value = self.after(dt, inc=inc)
+        n = 0
+        while value is not None and (count is None or n < count):
+            yield value
+            n += 1
+            value = self.after(value)
+
+    def _day_candidates(self, day: date) -> Iterator[datetime]:
+        tzinfo = self.dtstart.tzinfo
+        for hour, minute in self._times:
+            yield datetime(day.year, day.month, day.day, hour, minute, tzinfo=tzinfo)
+
+    def _after_periodic(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        # Closed-form jump: occurrences are dtstart + n * step, so the first one
+        # past target is found with a single integer division instead of a walk.
+        # Index 0 is dtstart itself, kept as is: adding a timedelta resets fold.
+        elapsed_us = (target - self.dtstart) // _MICROSECOND
+        n = _next_period_index(elapsed_us, self._step_us, inclusive)
+        while True:
+            candidate = self.dtstart + n * self._step if n else self.dtstart
+            if upper_bound is not None and candidate > upper_bound:
+                return None
+            # The wall-clock index can only be off within a repeated hour.
+            value = _past_target(candidate, target, inclusive)
+            if value is not None:
+                return value
+            n += 1
+
+    def _after_minutely(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        return self._after_periodic(target, inclusive, upper_bound)
+
+    def _after_hourly(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        return self._after_periodic(target, inclusive, upper_bound)
+
+    def _after_daily(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        if len(self._times) > 1:
+            return self._after_daily_times(target, inclusive, upper_bound)
+        candidate = self._after_periodic(target, inclusive, upper_bound)
+        if candidate is None or self._daily_skip is None:
+            return candidate
+
+        # The skip table replaces a step-by-step walk: a single lookup gives the
+        # number of steps to the next allowed weekday.
+        steps = self._daily_skip[candidate.weekday()]
+        if steps is None:
+            return None
+        if steps:
+            candidate += steps * self._step
+            if upper_bound is not None and candidate > upper_bound:
+                return None
         return candidate
 
-    def _after_daily(self, target: datetime, inclusive: bool) -> Optional[datetime]:
-        step = timedelta(days=self.interval)
-        candidate = self.dtstart
-        while candidate < target or (not inclusive and candidate == target):
-            candidate += step
-
+    def _after_daily_times(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        # Several times a day: start from the first interval-aligned day not
+        # before target's day; if all its times are past, the next one wins.
+        target_day = target.toordinal()
+        start_day = self.dtstart.toordinal()
+        day_ord = start_day + max(0, -((start_day - target_day) // self.interval)) * self.interval
         while True:
-            if self.byweekday is None or candidate.weekday() in self.byweekday:
-                return candidate
-            candidate += step
-
-    def _weekly_candidates_for_week(self, week_start: date) -> List[datetime]:
-        weekdays = self.byweekday or [self.dtstart.weekday()]
-        candidates = []
-        for wd in sorted(set(weekdays)):
-            day = week_start + timedelta(days=wd)
-            dt = datetime(day.year, day.month, day.day, tzinfo=self.dtstart.tzinfo)
-            candidates.append(self._time_for(dt))
-        return sorted(candidates)
-
-    def _after_weekly(self, target: datetime, inclusive: bool) -> Optional[datetime]:
+            if self._daily_skip is not None:
+                # Ordinal 1 is a Monday
+                steps = self._daily_skip[(day_ord - 1) % 7]
+                if steps is None:
+                    return None
+                day_ord += steps * self.interval
+            for candidate in self._day_candidates(date.fromordinal(day_ord)):
+                if upper_bound is not None and candidate > upper_bound:
+                    return None
+                value = _past_target(candidate, target, inclusive)
+                if value is not None:
+                    return value
+            day_ord += self.interval
+
+    def _weekly_candidates_for_week(self, week_start: date) -> Iterator[datetime]:
+        for wd in self._week_days:
+            yield from self._day_candidates(week_start + timedelta(days=wd))
+
+    def _after_weekly(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
         anchor_week = _week_start(self.dtstart.date())
-        weeks = 0
+        bound_day = upper_bound.date() if upper_bound is not None else None
+        # Start one period before the week holding target; the loop below
+        # only has to refine from there.
+        delta_weeks = (_week_start(target.date()) - anchor_week).days // 7
+        weeks = max(0, delta_weeks // self.interval - 1)
         while True:
             week_start = anchor_week + timedelta(weeks=self.interval * weeks)
+            if bound_day is not None and week_start > bound_day:
+                return None
             for candidate in self._weekly_candidates_for_week(week_start):
-                if candidate > target or (inclusive and candidate == target):
-                    return candidate
+                value = _past_target(candidate, target, inclusive)
+                if value is not None:
+                    return value
             weeks += 1
 
-    def _month_candidates(self, year: int, month: int) -> List[datetime]:
-        tzinfo = self.dtstart.tzinfo
-        if self.bymonth and month not in self.bymonth:
-            return []
-
-        candidates: List[datetime] = []
+    def _month_days(self, year: int, month: int) -> List[int]:
+        # Days of the month matching the rule, ascending and without duplicates.
+        last_day = _last_day_of_month(year, month)
         if self.bysetpos and self.byweekday:
-            matches = []
-            last_day = _last_day_of_month(year, month)
-            for day in range(1, last_day + 1):
-                d = date(year, month, day)
-                if d.weekday() in self.byweekday:
-                    matches.append(d)
+            matches = [
+                day
+                for day in range(1, last_day + 1)
+                if date(year, month, day).weekday() in self._byweekday_set
+            ]
+            indexes = set()
             for pos in self.bysetpos:
                 if pos == 0:
                     continue
-                idx = pos - 1 if pos > 0 else pos
-                try:
-                    chosen = matches[idx]
-                except IndexError:
-                    continue
-                dt = datetime(chosen.year, chosen.month, chosen.day, tzinfo=tzinfo)
-                candidates.append(self._time_for(dt))
-        elif self.bymonthday:
-            last_day = _last_day_of_month(year, month)
-            for day in self.bymonthday:
-                if day == -1:
-                    d = date(year, month, last_day)
-                else:
-                    if not (1 <= day <= last_day):
-                        continue
-                    d = date(year, month, day)
-                dt = datetime(d.year, d.month, d.day, tzinfo=tzinfo)
-                candidates.append(self._time_for(dt))
-        else:
-            dt = datetime(year, month, self.dtstart.day, tzinfo=tzinfo)
-            candidates.append(self._time_for(dt))
-
-        return sorted(set(candidates))
-
-    def _after_monthly(self, target: datetime, inclusive: bool) -> Optional[datetime]:
+                idx = pos - 1 if pos > 0 else len(matches) + pos
+                if 0 <= idx < len(matches):
+                    indexes.add(idx)
+            return [matches[idx] for idx in sorted(indexes)]
+        if self.bymonthday:
+            days = [day for day in self._monthdays if day <= last_day]
+            if self._monthday_last and (not days or days[-1] != last_day):
+                days.append(last_day)
+            return days
+        # Months too short for dtstart's day have no occurrence, as in RFC 5545.
+        day = self.dtstart.day
+        return [day] if day <= last_day else []
+
+    def _month_candidates(self, year: int, month: int) -> Iterator[datetime]:
+        if self._bymonth_set is not None and month not in self._bymonth_set:
+            return
+        for day in self._month_days(year, month):
+            yield from self._day_candidates(date(year, month, day))
+
+    def _after_monthly(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
         anchor_year = self.dtstart.year
         anchor_month = self.dtstart.month
-        months = 0
+        bound_month = (upper_bound.year, upper_bound.month) if upper_bound is not None else None
+        delta_months = (target.year - anchor_year) * 12 + (target.month - anchor_month)
+        months = max(0, delta_months // self.interval - 1)
         while True:
             year, month = _add_months(anchor_year, anchor_month, self.interval * months)
+            if year > MAXYEAR:
+                return None
+            if bound_month is not None and (year, month) > bound_month:
+                return None
             for candidate in self._month_candidates(year, month):
-                if candidate > target or (inclusive and candidate == target):
-                    return candidate
+                value = _past_target(candidate, target, inclusive)
+                if value is not None:
+                    return value
             months += 1
 
-    def _year_candidates(self, year: int) -> List[datetime]:
-        months = self.bymonth or [self.dtstart.month]
-        candidates: List[datetime] = []
-        for month in months:
-            candidates.extend(self._month_candidates(year, month))
-        return sorted(candidates)
+    def _year_candidates(self, year: int) -> Iterator[datetime]:
+        # Months are visited in ascending order and each month's candidates are
+        # already sorted, so the concatenation is sorted without a final sort.
+        for month in self._year_months:
+            yield from self._month_candidates(year, month)
 
-    def _after_yearly(self, target: datetime, inclusive: bool) -> Optional[datetime]:
+    def _after_yearly(
+        self, target: datetime, inclusive: bool, upper_bound: Optional[datetime] = None
+    ) -> Optional[datetime]:
         anchor_year = self.dtstart.year
-        years = 0
+        bound_year = upper_bound.year if upper_bound is not None else MAXYEAR
+        years = max(0, (target.year - anchor_year) // self.interval - 1)
         while True:
             year = anchor_year + self.interval * years
+            if year > bound_year:
+                return None
             for candidate in self._year_candidates(year):
-                if candidate > target or (inclusive and candidate == target):
-                    return candidate
+                value = _past_target(candidate, target, inclusive)
+                if value is not None:
+                    return value
             years += 1
 
 
 class rruleset:
+    __slots__ = ("_rules",)
+
     def __init__(self) -> None:
         self._rules: List[rrule] = []
 
@@ -224,6 +416,25 @@ class rruleset:
         self._rules.append(rule)
 
     def after(self, dt: datetime, inc: bool = False) -> Optional[datetime]:
-        next_values = [rule.after(dt, inc=inc) for rule in self._rules]
-        candidates = [value for value in next_values if value is not None]
-        return min(candidates) if candidates else None
+        # Each rule only has to beat the best value found so far, so rules
+        # that would walk far past it give up early and report None.
+        best: Optional[datetime] = None
+        for rule in self._rules:
+            value = rule.after(dt, inc=inc, upper_bound=best)
+            if value is not None and (best is None or value < best):
+                best = value
+        return best
+
+    def xafter(self, dt: datetime, count: Optional[int] = None, inc: bool = False) -> Iterator[datetime]:
+        # Lazy merge of the rules' own iterators; values produced by several
+        # rules are yielded once.
+        last: Optional[datetime] = None
+        n = 0
+        for value in merge(*(rule.xafter(dt, inc=inc) for rule in self._rules)):
+            if value == last:
+                continue
+            if count is not None and n >= count:
+                return
+            yield value
+            last = value
+            n += 1
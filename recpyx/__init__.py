@@ -1,4 +1,4 @@
-from .engine import InvalidRuleError, next_occurrence, validate
+from .engine import InvalidRuleError, load_precompiled, next_occurrence, precompile, validate
 from .en import IRSchedule, IRRule, parse_schedule as parse_schedule_en, parse_rule as parse_rule_en
 from .fr import parse_schedule as parse_schedule_fr, parse_rule as parse_rule_fr
 from .parser import parse_schedule, parse_rule
@@ -7,6 +7,7 @@ __all__ = [
     "InvalidRuleError",
     "IRSchedule",
     "IRRule",
+    "load_precompiled",
     "next_occurrence",
     "parse_rule",
     "parse_schedule",
@@ -14,5 +15,6 @@ __all__ = [
     "parse_rule_en",
     "parse_schedule_fr",
     "parse_rule_fr",
+    "precompile",
     "validate",
 ]
@@ -14,12 +14,77 @@ Notes:
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, time, date
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 _TIME_RE = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*$", re.I)
 _DATE_RE = re.compile(r"^\s*(\d{4})-(\d{2})-(\d{2})\s*$")
+_SUFFIX_RE = re.compile(
+    r"^(?P<head>.*)\s+(?:"
+    r"if\s+weekend\s+then\s+next\s+(?P<ws>monday|business day)"
+    r"|between\s+(?P<bs>\d{4}-\d{2}-\d{2})\s+and\s+(?P<be>\d{4}-\d{2}-\d{2})"
+    r"|until\s+(?P<u>\d{4}-\d{2}-\d{2})"
+    r"|except\s+(?P<ex>.+)"
+    r")\s*$"
+)
+_EXCEPT_RE = re.compile(r"\s+except\s+(.+)$")
+# Order in which a pass of parse_rule() strips the suffixes matched above.
+_SUFFIX_STEPS = {"ws": 0, "be": 1, "u": 2}
+
+# Rule patterns, compiled once at import.
+_WS_RE = re.compile(r"\s+")
+_TZ_SUFFIX_RE = re.compile(r"\s+in\s+([A-Za-z_]+/[A-Za-z_]+)\s*$")
+_RULE_SPLIT_RE = re.compile(r"\s*,\s*and\s+", re.I)
+_LIST_SEP_RE = re.compile(r"[,\s]+")
+_AT_RE = re.compile(r"\s+at\s+")
+_MID_EXCEPT_RE = re.compile(r"\s+except\s+(.+?)\s+at\s+")
+_WEEKDAY_NAMES = "monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+
+# Rule shapes in the order parse_rule() tries them; the rule's shape is the
+# first alternative of _RULE_RE that matches it in full.
+_RULE_SHAPES = [
+    ("oneshot", r"(?P<od>\d{4}-\d{2}-\d{2})\s+at\s+(?P<ot>.+)"),
+    ("yearly_date", r"every\s+year\s+on\s+(?P<yd_month>\d{2})-(?P<yd_day>\d{2})\s+at\s+(?P<yd_at>.+)"),
+    ("yearly", r"every\s+year\b(?:\s+at\s+(?P<y_at>.+))?"),
+    ("step_within_day",
+     r"every\s+(?P<sd_base>day|weekday)\s+every\s+(?P<sd_n>\d+)\s+(?P<sd_unit>hours|minutes)\s+"
+     r"between\s+(?P<sd_t1>.+?)\s+and\s+(?P<sd_t2>.+)"),
+    ("every_n_hours_between", r"every\s+(?P<nhb_n>\d+)\s+hours\s+between\s+(?P<nhb_t1>.+?)\s+and\s+(?P<nhb_t2>.+)"),
+    ("every_hour_between", r"every\s+hour\s+between\s+(?P<hb_t1>.+?)\s+and\s+(?P<hb_t2>.+)"),
+    ("every_n",
+     r"every\s+(?P<n_n>\d+)\s+(?P<n_unit>minutes|hours|days|weeks)"
+     r"(?:\s+on\s+(?P<n_on>.+?))?(?:\s+at\s+(?P<n_at>.+))?"),
+    ("every_minute_hour", r"every\s+(?P<mh_unit>minute|hour)(?:\s+at\s+(?P<mh_at>.+))?"),
+    ("every_weekday_at", r"every\s+weekday\s+at\s+(?P<wd_at>.+)"),
+    ("every_day_at", r"every\s+day\s+at\s+(?P<da_at>.+)"),
+    ("every_day", r"every\s+day\b(?:\s+at\s+(?P<d_at>.+))?"),
+    # only weekday names (and "and") between "every" and "at"
+    ("weekday_list",
+     r"every\s+(?P<wl_days>[,\s]*(?:" + _WEEKDAY_NAMES + r"|and)(?:[,\s]+(?:" + _WEEKDAY_NAMES + r"|and))*[,\s]*)"
+     r"\s+at\s+(?P<wl_at>.+)"),
+    ("yearly_nth_of_months",
+     r"every\s+year\s+on\s+the\s+"
+     r"(?P<ynm_pos>first|second|third|fourth|fifth|last)\s+"
+     r"(?P<ynm_wd>" + _WEEKDAY_NAMES + r")\s+"
+     r"of\s+"
+     r"(?P<ynm_months>.+?)\s+"
+     r"at\s+(?P<ynm_at>.+)"),
+    ("yearly_nth_of_month",
+     r"every\s+year\s+on\s+the\s+"
+     r"(?P<yn_pos>first|second|third|fourth|fifth|last)\s+"
+     r"(?P<yn_wd>" + _WEEKDAY_NAMES + r")\s+"
+     r"of\s+"
+     r"(?P<yn_month>january|february|march|april|may|june|july|august|september|october|november|december)\s+"
+     r"at\s+(?P<yn_at>.+)"),
+    ("monthly", r"every\s+month\b(?:\s+at\s+(?P<mo_at>.+))?"),
+    ("monthly_on_the", r"every\s+month\s+on\s+the\s+(?P<mon_on>.+?)\s+at\s+(?P<mon_at>.+)"),
+]
+_RULE_RE = re.compile("|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _RULE_SHAPES))
+_AND_SPLIT_RE = re.compile(r"\s+and\s+")
+_MONTH_DAY_NUM_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?")
+_ORDINAL_WEEKDAY_RE = re.compile(r"(first|second|third|fourth|fifth|last)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)")
 
 WEEKDAY_MAP = {
     "monday": 0,
@@ -31,6 +96,8 @@ WEEKDAY_MAP = {
     "sunday": 6,
 }
 WEEKDAYS = set(WEEKDAY_MAP.keys())
+# A weekday name standing alone between spaces/commas (the list separators).
+_WEEKDAY_TOKEN_RE = re.compile(r"(?<![^\s,])(" + "|".join(WEEKDAY_MAP) + r")(?![^\s,])")
 
 ORDINAL = {
     "first": 1, "1st": 1,
@@ -42,7 +109,14 @@ ORDINAL = {
 }
 
 def parse_time(s: str) -> time:
-    m = _TIME_RE.match(s.strip())
+    t = s.strip()
+    # Fast path for the common H:MM / HH:MM form, without the regex
+    if len(t) in (4, 5) and t[-3] == ":" and t[:-3].isdecimal() and t[-2:].isdecimal():
+        h, mi = int(t[:-3]), int(t[-2:])
+        if h <= 23 and mi <= 59:
+            return time(h, mi)
+
+    m = _TIME_RE.match(t)
     if not m:
         raise ValueError(f"Invalid time: {s!r}")
     h = int(m.group(1))
@@ -71,46 +145,54 @@ def parse_date(s: str) -> date:
         raise ValueError(f"Invalid date: {s!r} (expected YYYY-MM-DD)")
     return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
 
+def _parse_times(text: str) -> Tuple[time, ...]:
+    # "09:00, 12:00 and 18:00" -> one time per token, "and" skipped
+    return tuple(parse_time(c) for c in _LIST_SEP_RE.split(text) if c and c.lower() != "and")
+
 def parse_weekday_list(text: str) -> List[str]:
-    t = text.strip().lower().replace(",", " ")
-    words = [w for w in t.split() if w not in {"and"}]
-    return [w for w in words if w in WEEKDAYS]
+    return _WEEKDAY_TOKEN_RE.findall(text.lower())
 
 def _normalize_tz(tz: str) -> str:
     tz = tz.strip().replace("\\", "/")
-    tz = re.sub(r"\s+", "", tz)
+    tz = _WS_RE.sub("", tz)
     return tz
 
 # ------------------ IR dataclasses (v1) ------------------
 
-@dataclass
+# No per-instance __dict__ for IR objects; slots=True needs Python 3.10+.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# The IR is immutable once parsed: frozen dataclasses with tuple fields, so
+# parsed schedules can be shared and used as cache keys.
+
+@dataclass(frozen=True, **_SLOTS)
 class IRHolidaySpec:
     enabled: bool = False
     country: Optional[str] = None  # e.g. "FR"
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IRExcept:
-    weekdays: List[int] = field(default_factory=list)  # 0..6
-    dates: List[date] = field(default_factory=list)
+    weekdays: Tuple[int, ...] = ()  # 0..6
+    dates: Tuple[date, ...] = ()
     holidays: IRHolidaySpec = field(default_factory=IRHolidaySpec)
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IRWindowDate:
     start: Optional[date] = None
     end: Optional[date] = None
     until: Optional[date] = None
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IRBetweenTime:
     start: time
     end: time
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IRStep:
     minutes: Optional[int] = None
     hours: Optional[int] = None
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IRRule:
     type: str  # "rrule" | "oneshot"
 
@@ -120,11 +202,11 @@ class IRRule:
     # rrule fields
     freq: Optional[str] = None               # minutely|hourly|daily|weekly|monthly|yearly
     interval: int = 1
-    bymonth: Optional[List[int]] = None
-    byweekday: Optional[List[int]] = None     # 0..6
-    bymonthday: Optional[List[int]] = None    # 1..31 or -1
-    bysetpos: Optional[List[int]] = None      # 1..5 or -1
-    times: List[time] = field(default_factory=list)
+    bymonth: Optional[Tuple[int, ...]] = None
+    byweekday: Optional[Tuple[int, ...]] = None   # 0..6
+    bymonthday: Optional[Tuple[int, ...]] = None  # 1..31 or -1
+    bysetpos: Optional[Tuple[int, ...]] = None    # 1..5 or -1
+    times: Tuple[time, ...] = ()
 
     between_time: Optional[IRBetweenTime] = None
     step: Optional[IRStep] = None
@@ -133,10 +215,10 @@ class IRRule:
     except_: IRExcept = field(default_factory=IRExcept)
     weekend_shift: str = "none"  # none|next_monday|next_business_day
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IRSchedule:
     tz: str = "Europe/Paris"
-    rules: List[IRRule] = field(default_factory=list)
+    rules: Tuple[IRRule, ...] = ()
     version: str = "1"
 
 # ------------------ EN -> IR parsing ------------------
@@ -145,176 +227,161 @@ def parse_schedule(text: str, default_tz: str = "Europe/Paris") -> IRSchedule:
     raw = " ".join(text.strip().split())
 
     tz = default_tz
-    m = re.search(r"\s+in\s+([A-Za-z_]+/[A-Za-z_]+)\s*$", raw)
+    m = _TZ_SUFFIX_RE.search(raw)
     if m:
         tz = _normalize_tz(m.group(1))
         raw = raw[: m.start()].strip()
 
     # IMPORTANT: split composed rules ONLY on ", and"
-    rule_texts = re.split(r"\s*,\s*and\s+", raw, flags=re.I)
-    rules = [parse_rule(rt.strip()) for rt in rule_texts if rt.strip()]
+    rule_texts = _RULE_SPLIT_RE.split(raw)
+    rules = tuple(parse_rule(rt.strip()) for rt in rule_texts if rt.strip())
     return IRSchedule(tz=tz, rules=rules)
 
 def parse_rule(text: str) -> IRRule:
     s_lower = " ".join(text.strip().split()).lower()
 
+    # Suffixes are collected into locals; the frozen IR is built once below.
     weekend_shift = "none"
-    window = IRWindowDate()
-    ex = IRExcept()
+    w_start: Optional[date] = None
+    w_end: Optional[date] = None
+    w_until: Optional[date] = None
+    ex_weekdays: List[int] = []
+    ex_dates: List[date] = []
+    ex_holidays = False
 
     def apply_except(ex_text: str) -> None:
+        nonlocal ex_holidays
         ex_text = ex_text.strip().lower()
 
         if ex_text in {"on public holidays", "public holidays"}:
-            ex.holidays.enabled = True
+            ex_holidays = True
             return
 
         for w in parse_weekday_list(ex_text):
             idx = WEEKDAY_MAP[w]
-            if idx not in ex.weekdays:
-                ex.weekdays.append(idx)
+            if idx not in ex_weekdays:
+                ex_weekdays.append(idx)
 
-        for token in re.split(r"[,\s]+", ex_text):
+        for token in _LIST_SEP_RE.split(ex_text):
             if _DATE_RE.match(token):
                 d = parse_date(token)
-                if d not in ex.dates:
-                    ex.dates.append(d)
+                if d not in ex_dates:
+                    ex_dates.append(d)
 
     # ---- strip suffixes in ANY order (loop until nothing changes) ----
+    # Each pass strips the weekend shift, date window and until suffixes found
+    # at the end, in that order, then the except clause. _SUFFIX_RE finds the
+    # suffix at the end in one match: its greedy head leaves the rightmost one.
+    pass_step = -1
+    changed = False
     while True:
-        changed = False
-
-        m = re.search(r"\s+if\s+weekend\s+then\s+next\s+(monday|business day)\s*$", s_lower)
-        if m:
-            weekend_shift = "next_monday" if m.group(1) == "monday" else "next_business_day"
-            s_lower = s_lower[: m.start()].strip()
-            changed = True
-
-        m = re.search(r"\s+between\s+(\d{4}-\d{2}-\d{2})\s+and\s+(\d{4}-\d{2}-\d{2})\s*$", s_lower)
-        if m:
-            window.start = parse_date(m.group(1))
-            window.end = parse_date(m.group(2))
-            s_lower = s_lower[: m.start()].strip()
-            changed = True
+        m = _SUFFIX_RE.match(s_lower)
+        if not m:
+            break
 
-        m = re.search(r"\s+until\s+(\d{4}-\d{2}-\d{2})\s*$", s_lower)
-        if m:
-            window.until = parse_date(m.group(1))
-            s_lower = s_lower[: m.start()].strip()
+        order = _SUFFIX_STEPS.get(m.lastgroup)
+        if order is not None and order > pass_step:
+            pass_step = order
+            if m.lastgroup == "ws":
+                weekend_shift = "next_monday" if m.group("ws") == "monday" else "next_business_day"
+            elif m.lastgroup == "be":
+                w_start = parse_date(m.group("bs"))
+                w_end = parse_date(m.group("be"))
+            else:
+                w_until = parse_date(m.group("u"))
+            s_lower = m.group("head").strip()
             changed = True
+            continue
 
-        m = re.search(r"\s+except\s+(.+)$", s_lower)
+        # an except clause runs from the first "except" to the end
+        m = _EXCEPT_RE.search(s_lower)
         if m:
             ex_text = m.group(1).strip()
             # if it contains " at ", it's likely mid-except ("... except X at Y")
-            if re.search(r"\s+at\s+", ex_text):
-                pass
-            else:
+            if not _AT_RE.search(ex_text):
                 apply_except(ex_text)
                 s_lower = s_lower[: m.start()].strip()
                 changed = True
 
         if not changed:
             break
+        pass_step = -1
+        changed = False
 
     # ---- mid-except: "... except XXX at ..." ----
-    m = re.search(r"\s+except\s+(.+?)\s+at\s+", s_lower)
+    m = _MID_EXCEPT_RE.search(s_lower)
     if m:
         apply_except(m.group(1))
         s_lower = s_lower[: m.start()] + " at " + s_lower[m.end():]
         s_lower = " ".join(s_lower.split())
 
+    window = IRWindowDate(w_start, w_end, w_until) if (w_start or w_end or w_until) else None
+    ex = IRExcept(tuple(ex_weekdays), tuple(ex_dates), IRHolidaySpec(enabled=ex_holidays))
+
+    # ---- rule shapes: one match tries them all, in order ----
+    m = _RULE_RE.fullmatch(s_lower)
+    if not m:
+        raise ValueError(f"Unsupported rule: {text!r}")
+    kind = m.lastgroup
+
     # ---- oneshot: YYYY-MM-DD at TIME ----
-    m = re.fullmatch(r"(\d{4}-\d{2}-\d{2})\s+at\s+(.+)", s_lower)
-    if m:
-        d = parse_date(m.group(1))
-        t = parse_time(m.group(2))
-        r = IRRule(type="oneshot", at=datetime(d.year, d.month, d.day, t.hour, t.minute, 0, 0))
-        r.window_date = IRWindowDate(start=d, end=d)
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+    if kind == "oneshot":
+        d = parse_date(m.group("od"))
+        t = parse_time(m.group("ot"))
+        return IRRule(type="oneshot", at=datetime(d.year, d.month, d.day, t.hour, t.minute, 0, 0),
+                      window_date=IRWindowDate(start=d, end=d), except_=ex, weekend_shift=weekend_shift)
 
     # ---- every year on MM-DD at T ----
-    m = re.fullmatch(r"every\s+year\s+on\s+(\d{2})-(\d{2})\s+at\s+(.+)", s_lower)
-    if m:
-        mm = int(m.group(1))
-        dd = int(m.group(2))
-        at = parse_time(m.group(3))
-        r = IRRule(type="rrule", freq="yearly", interval=1, bymonth=[mm], bymonthday=[dd], times=[at])
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+    if kind == "yearly_date":
+        mm = int(m.group("yd_month"))
+        dd = int(m.group("yd_day"))
+        at = parse_time(m.group("yd_at"))
+        return IRRule(type="rrule", freq="yearly", interval=1, bymonth=(mm,), bymonthday=(dd,), times=(at,),
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every year (without date) ----
-    m = re.fullmatch(r"every\s+year\b(?:\s+at\s+(.+))?", s_lower)
-    if m:
-        at_part = m.group(1)
-        times: List[time] = []
+    if kind == "yearly":
+        at_part = m.group("y_at")
+        times: Tuple[time, ...] = ()
         if at_part:
-            at_part = at_part.replace(",", " ")
-            chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-            times = [parse_time(c) for c in chunks]
-        r = IRRule(type="rrule", freq="yearly", interval=1, times=times)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+            times = _parse_times(at_part)
+        return IRRule(type="rrule", freq="yearly", interval=1, times=times,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- step within day: every day/weekday every N hours/minutes between t1 and t2 ----
-    m = re.fullmatch(
-        r"every\s+(day|weekday)\s+every\s+(\d+)\s+(hours|minutes)\s+between\s+(.+?)\s+and\s+(.+)",
-        s_lower,
-    )
-    if m:
-        base = m.group(1)
-        n = int(m.group(2))
-        unit = m.group(3)
-        t1 = parse_time(m.group(4))
-        t2 = parse_time(m.group(5))
-        bywd = [0, 1, 2, 3, 4] if base == "weekday" else None
+    if kind == "step_within_day":
+        base = m.group("sd_base")
+        n = int(m.group("sd_n"))
+        unit = m.group("sd_unit")
+        t1 = parse_time(m.group("sd_t1"))
+        t2 = parse_time(m.group("sd_t2"))
+        bywd: Optional[Tuple[int, ...]] = (0, 1, 2, 3, 4) if base == "weekday" else None
         step = IRStep(hours=n) if unit == "hours" else IRStep(minutes=n)
-        r = IRRule(type="rrule", freq="daily", interval=1, byweekday=bywd,
-                   between_time=IRBetweenTime(t1, t2), step=step)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+        return IRRule(type="rrule", freq="daily", interval=1, byweekday=bywd,
+                      between_time=IRBetweenTime(t1, t2), step=step,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every N hours between t1 and t2 ----
-    m = re.fullmatch(r"every\s+(\d+)\s+hours\s+between\s+(.+?)\s+and\s+(.+)", s_lower)
-    if m:
-        n = int(m.group(1))
-        t1 = parse_time(m.group(2))
-        t2 = parse_time(m.group(3))
-        r = IRRule(type="rrule", freq="hourly", interval=n, between_time=IRBetweenTime(t1, t2))
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+    if kind == "every_n_hours_between":
+        n = int(m.group("nhb_n"))
+        t1 = parse_time(m.group("nhb_t1"))
+        t2 = parse_time(m.group("nhb_t2"))
+        return IRRule(type="rrule", freq="hourly", interval=n, between_time=IRBetweenTime(t1, t2),
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every hour between t1 and t2 ----
-    m = re.fullmatch(r"every\s+hour\s+between\s+(.+?)\s+and\s+(.+)", s_lower)
-    if m:
-        t1 = parse_time(m.group(1))
-        t2 = parse_time(m.group(2))
-        r = IRRule(type="rrule", freq="hourly", interval=1, between_time=IRBetweenTime(t1, t2))
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+    if kind == "every_hour_between":
+        t1 = parse_time(m.group("hb_t1"))
+        t2 = parse_time(m.group("hb_t2"))
+        return IRRule(type="rrule", freq="hourly", interval=1, between_time=IRBetweenTime(t1, t2),
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every <n> units [on ...] [at ...] ----
-    m = re.fullmatch(
-        r"every\s+(\d+)\s+(minutes|hours|days|weeks)(?:\s+on\s+(.+?))?(?:\s+at\s+(.+))?",
-        s_lower,
-    )
-    if m:
-        n = int(m.group(1))
-        unit = m.group(2)
-        on_part = (m.group(3) or "").strip()
-        at_part = (m.group(4) or "").strip()
+    if kind == "every_n":
+        n = int(m.group("n_n"))
+        unit = m.group("n_unit")
+        on_part = (m.group("n_on") or "").strip()
+        at_part = (m.group("n_at") or "").strip()
 
         freq = {"minutes": "minutely", "hours": "hourly", "days": "daily", "weeks": "weekly"}[unit]
 
@@ -322,198 +389,128 @@ def parse_rule(text: str) -> IRRule:
         if on_part:
             wds = parse_weekday_list(on_part)
             if wds:
-                bywd = [WEEKDAY_MAP[w] for w in wds]
+                bywd = tuple(WEEKDAY_MAP[w] for w in wds)
 
-        times: List[time] = []
+        times = ()
         if at_part:
-            at_part = at_part.replace(",", " ")
-            chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-            times = [parse_time(c) for c in chunks]
+            times = _parse_times(at_part)
 
-        r = IRRule(type="rrule", freq=freq, interval=n, byweekday=bywd, times=times)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+        return IRRule(type="rrule", freq=freq, interval=n, byweekday=bywd, times=times,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every minute/hour (singular, without number) ----
-    m = re.fullmatch(r"every\s+(minute|hour)(?:\s+at\s+(.+))?", s_lower)
-    if m:
-        unit = m.group(1)
+    if kind == "every_minute_hour":
+        unit = m.group("mh_unit")
         freq = {"minute": "minutely", "hour": "hourly"}[unit]
-        times: List[time] = []
-        at_part = m.group(2)
+        times = ()
+        at_part = m.group("mh_at")
         if at_part:
-            at_part = at_part.replace(",", " ")
-            chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-            times = [parse_time(c) for c in chunks]
-        r = IRRule(type="rrule", freq=freq, interval=1, times=times)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+            times = _parse_times(at_part)
+        return IRRule(type="rrule", freq=freq, interval=1, times=times,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every weekday at ... ----
-    m = re.fullmatch(r"every\s+weekday\s+at\s+(.+)", s_lower)
-    if m:
-        at_part = m.group(1).replace(",", " ")
-        chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-        times = [parse_time(c) for c in chunks]
-        r = IRRule(type="rrule", freq="daily", interval=1, byweekday=[0, 1, 2, 3, 4], times=times)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+    if kind == "every_weekday_at":
+        times = _parse_times(m.group("wd_at"))
+        return IRRule(type="rrule", freq="daily", interval=1, byweekday=(0, 1, 2, 3, 4), times=times,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every day at ... ----
-    m = re.fullmatch(r"every\s+day\s+at\s+(.+)", s_lower)
-    if m:
-        at_part = m.group(1).replace(",", " ")
-        chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-        times = [parse_time(c) for c in chunks]
-        r = IRRule(type="rrule", freq="daily", interval=1, times=times)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+    if kind == "every_day_at":
+        times = _parse_times(m.group("da_at"))
+        return IRRule(type="rrule", freq="daily", interval=1, times=times,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every day (without time) ----
-    m = re.fullmatch(r"every\s+day\b(?:\s+at\s+(.+))?", s_lower)
-    if m:
-        at_part = m.group(1)
-        times: List[time] = []
+    if kind == "every_day":
+        at_part = m.group("d_at")
+        times = ()
         if at_part:
-            at_part = at_part.replace(",", " ")
-            chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-            times = [parse_time(c) for c in chunks]
-        r = IRRule(type="rrule", freq="daily", interval=1, times=times)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+            times = _parse_times(at_part)
+        return IRRule(type="rrule", freq="daily", interval=1, times=times,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every <weekday list> at ... ----
-    m = re.fullmatch(r"every\s+(.+?)\s+at\s+(.+)", s_lower)
-    if m:
-        days_part = m.group(1).strip()
-        at_part = m.group(2).strip()
-        tokens = [t for t in re.split(r"[,\s]+", days_part) if t and t != "and"]
+    if kind == "weekday_list":
+        days_part = m.group("wl_days").strip()
+        at_part = m.group("wl_at").strip()
+        tokens = [t for t in _LIST_SEP_RE.split(days_part) if t and t != "and"]
         if tokens and all(t in WEEKDAYS for t in tokens):
-            at_part = at_part.replace(",", " ")
-            chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-            times = [parse_time(c) for c in chunks]
-            r = IRRule(type="rrule", freq="weekly", interval=1,
-                       byweekday=[WEEKDAY_MAP[w] for w in tokens],
-                       times=times)
-            r.window_date = window if (window.start or window.end or window.until) else None
-            r.except_ = ex
-            r.weekend_shift = weekend_shift
-            return r
+            times = _parse_times(at_part)
+            return IRRule(type="rrule", freq="weekly", interval=1,
+                          byweekday=tuple(WEEKDAY_MAP[w] for w in tokens),
+                          times=times,
+                          window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- yearly: every year on the last sunday of march and october at 23:00 ----
-    m = re.fullmatch(
-        r"every\s+year\s+on\s+the\s+"
-        r"(first|second|third|fourth|fifth|last)\s+"
-        r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+"
-        r"of\s+"
-        r"(.+?)\s+"
-        r"at\s+(.+)",
-        s_lower,
-    )
-    if m:
+    if kind == "yearly_nth_of_months":
         month_map = {
             "january": 1, "february": 2, "march": 3, "april": 4,
             "may": 5, "june": 6, "july": 7, "august": 8,
             "september": 9, "october": 10, "november": 11, "december": 12,
         }
-        pos = ORDINAL[m.group(1)]
-        wd = WEEKDAY_MAP[m.group(2)]
-        months_str = m.group(3).strip()
+        pos = ORDINAL[m.group("ynm_pos")]
+        wd = WEEKDAY_MAP[m.group("ynm_wd")]
+        months_str = m.group("ynm_months").strip()
         months = []
-        for month_name in re.split(r"\s+and\s+", months_str):
+        for month_name in _AND_SPLIT_RE.split(months_str):
             month_name = month_name.strip().lower()
             if month_name in month_map:
                 months.append(month_map[month_name])
         if not months:
             raise ValueError(f"Unsupported rule: {text!r}")
-        at = parse_time(m.group(4))
-        r = IRRule(type="rrule", freq="yearly", interval=1,
-                   bymonth=months, byweekday=[wd], bysetpos=[pos], times=[at])
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+        at = parse_time(m.group("ynm_at"))
+        return IRRule(type="rrule", freq="yearly", interval=1,
+                      bymonth=tuple(months), byweekday=(wd,), bysetpos=(pos,), times=(at,),
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- yearly: every year on the last sunday of october at 23:00 ----
-    m = re.fullmatch(
-        r"every\s+year\s+on\s+the\s+"
-        r"(first|second|third|fourth|fifth|last)\s+"
-        r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+"
-        r"of\s+"
-        r"(january|february|march|april|may|june|july|august|september|october|november|december)\s+"
-        r"at\s+(.+)",
-        s_lower,
-    )
-    if m:
+    if kind == "yearly_nth_of_month":
         month_map = {
             "january": 1, "february": 2, "march": 3, "april": 4,
             "may": 5, "june": 6, "july": 7, "august": 8,
             "september": 9, "october": 10, "november": 11, "december": 12,
         }
-        pos = ORDINAL[m.group(1)]
-        wd = WEEKDAY_MAP[m.group(2)]
-        mm = month_map[m.group(3)]
-        at = parse_time(m.group(4))
-        r = IRRule(type="rrule", freq="yearly", interval=1,
-                   bymonth=[mm], byweekday=[wd], bysetpos=[pos], times=[at])
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+        pos = ORDINAL[m.group("yn_pos")]
+        wd = WEEKDAY_MAP[m.group("yn_wd")]
+        mm = month_map[m.group("yn_month")]
+        at = parse_time(m.group("yn_at"))
+        return IRRule(type="rrule", freq="yearly", interval=1,
+                      bymonth=(mm,), byweekday=(wd,), bysetpos=(pos,), times=(at,),
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every month (without date) ----
-    m = re.fullmatch(r"every\s+month\b(?:\s+at\s+(.+))?", s_lower)
-    if m:
-        at_part = m.group(1)
-        times: List[time] = []
+    if kind == "monthly":
+        at_part = m.group("mo_at")
+        times = ()
         if at_part:
-            at_part = at_part.replace(",", " ")
-            chunks = [c for c in at_part.split() if c.lower() not in {"and"}]
-            times = [parse_time(c) for c in chunks]
-        r = IRRule(type="rrule", freq="monthly", interval=1, times=times)
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+            times = _parse_times(at_part)
+        return IRRule(type="rrule", freq="monthly", interval=1, times=times,
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     # ---- every month on the ... at ... ----
-    m = re.fullmatch(r"every\s+month\s+on\s+the\s+(.+?)\s+at\s+(.+)", s_lower)
-    if m:
-        on_part = m.group(1).strip()
-        at = parse_time(m.group(2).strip())
+    if kind == "monthly_on_the":
+        on_part = m.group("mon_on").strip()
+        at = parse_time(m.group("mon_at").strip())
 
+        bymonthday: Optional[Tuple[int, ...]] = None
+        byweekday: Optional[Tuple[int, ...]] = None
+        bysetpos: Optional[Tuple[int, ...]] = None
         if on_part == "last day":
-            r = IRRule(type="rrule", freq="monthly", interval=1, bymonthday=[-1], times=[at])
+            bymonthday = (-1,)
         else:
-            nums = re.findall(r"(\d{1,2})(?:st|nd|rd|th)?", on_part)
+            nums = _MONTH_DAY_NUM_RE.findall(on_part)
             if nums and all(1 <= int(x) <= 31 for x in nums):
-                r = IRRule(type="rrule", freq="monthly", interval=1,
-                           bymonthday=[int(x) for x in nums], times=[at])
+                bymonthday = tuple(int(x) for x in nums)
             else:
-                m2 = re.fullmatch(
-                    r"(first|second|third|fourth|fifth|last)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
-                    on_part,
-                )
+                m2 = _ORDINAL_WEEKDAY_RE.fullmatch(on_part)
                 if not m2:
                     raise ValueError(f"Unsupported rule: {text!r}")
-                pos = ORDINAL[m2.group(1)]
-                wd = WEEKDAY_MAP[m2.group(2)]
-                r = IRRule(type="rrule", freq="monthly", interval=1,
-                           byweekday=[wd], bysetpos=[pos], times=[at])
-
-        r.window_date = window if (window.start or window.end or window.until) else None
-        r.except_ = ex
-        r.weekend_shift = weekend_shift
-        return r
+                byweekday = (WEEKDAY_MAP[m2.group(2)],)
+                bysetpos = (ORDINAL[m2.group(1)],)
+
+        return IRRule(type="rrule", freq="monthly", interval=1,
+                      bymonthday=bymonthday, byweekday=byweekday, bysetpos=bysetpos, times=(at,),
+                      window_date=window, except_=ex, weekend_shift=weekend_shift)
 
     raise ValueError(f"Unsupported rule: {text!r}")
@@ -8,21 +8,29 @@ Depends on:
 Public API:
   - next_occurrence(text, now=None, default_tz="Europe/Paris") -> datetime
   - validate(text, now=None, default_tz="Europe/Paris") -> None | raises InvalidRuleError
+  - precompile(rules, path, default_tz="Europe/Paris") -> None
+  - load_precompiled(path) -> int
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, time, date
+import hashlib
+import pickle
+from dataclasses import dataclass
+from calendar import monthrange
+from datetime import MAXYEAR, datetime, timedelta, date, tzinfo as tzinfo_base
+from functools import lru_cache
+from heapq import merge
 from zoneinfo import ZoneInfo
-from typing import Optional, List, Tuple
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional, List, Sequence, Tuple, Union
 
 from dateutil.rrule import (
-    rrule, rruleset,
+    rrule,
     MINUTELY, HOURLY, DAILY, WEEKLY, MONTHLY, YEARLY,
     MO, TU, WE, TH, FR, SA, SU,
 )
 
-from .parser import parse_schedule
+from .parser import parse_schedule, _parse_schedule_cached
 from .en import IRSchedule, IRRule, IRWindowDate, IRBetweenTime, IRStep
 
 class InvalidRuleError(ValueError):
@@ -39,88 +47,174 @@ FREQ_MAP = {
 
 IDX_TO_DU = [MO, TU, WE, TH, FR, SA, SU]
 
-def is_weekend(d: date) -> bool:
-    return d.weekday() >= 5
+_zi_cache: Dict[str, ZoneInfo] = {}
 
-def next_business_day(d: date) -> date:
-    while d.weekday() >= 5:
-        d += timedelta(days=1)
-    return d
+def _zi(name: str) -> ZoneInfo:
+    # One ZoneInfo per timezone name for the life of the process.
+    tzinfo = _zi_cache.get(name)
+    if tzinfo is None:
+        tzinfo = _zi_cache[name] = ZoneInfo(name)
+    return tzinfo
+
+# Days to add to reach the next business day, indexed by weekday.
+_BUSINESS_DAY_SHIFT = (0, 0, 0, 0, 0, 2, 1)
 
-def _combine_datetime(d: date, t: time, tzinfo: ZoneInfo) -> datetime:
-    return datetime(d.year, d.month, d.day, t.hour, t.minute, 0, 0, tzinfo)
+def next_business_day(d: date) -> date:
+    return d + timedelta(days=_BUSINESS_DAY_SHIFT[d.weekday()])
 
 def _window_datetimes(w: Optional[IRWindowDate], tzinfo: ZoneInfo) -> Tuple[Optional[datetime], Optional[datetime]]:
     if not w:
         return None, None
+    return _window_bounds(w.start, w.end, w.until, tzinfo)
 
+# Window bounds only depend on the window dates and the timezone: build them
+# once per window instead of on every lookup.
+@lru_cache(maxsize=1024)
+def _window_bounds(start: Optional[date], end: Optional[date], until: Optional[date], tzinfo: ZoneInfo) -> Tuple[Optional[datetime], Optional[datetime]]:
     start_dt = None
     end_dt = None
 
-    if w.start:
-        start_dt = datetime(w.start.year, w.start.month, w.start.day, 0, 0, 0, tzinfo=tzinfo)
-    if w.end:
-        end_dt = datetime(w.end.year, w.end.month, w.end.day, 23, 59, 0, tzinfo=tzinfo)
-    if w.until:
-        until_dt = datetime(w.until.year, w.until.month, w.until.day, 23, 59, 0, tzinfo=tzinfo)
+    if start:
+        start_dt = datetime(start.year, start.month, start.day, 0, 0, 0, tzinfo=tzinfo)
+    if end:
+        end_dt = datetime(end.year, end.month, end.day, 23, 59, 0, tzinfo=tzinfo)
+    if until:
+        until_dt = datetime(until.year, until.month, until.day, 23, 59, 0, tzinfo=tzinfo)
         end_dt = until_dt if end_dt is None else min(end_dt, until_dt)
 
     return start_dt, end_dt
 
-def _apply_weekend_shift(dt: datetime, mode: str) -> datetime:
-    if mode == "none":
-        return dt
-    d = dt.date()
-    if not is_weekend(d):
+# Weekend shift modes as per-weekday day offsets. Both modes land on the
+# Monday after a weekend; "none" (or an unknown mode) has no table.
+_WEEKEND_SHIFT_DAYS = {
+    "next_monday": tuple((7 - wd) % 7 if wd >= 5 else 0 for wd in range(7)),
+    "next_business_day": _BUSINESS_DAY_SHIFT,
+}
+
+def _apply_weekend_shift(dt: datetime, shift_days: Optional[Tuple[int, ...]]) -> datetime:
+    if shift_days is None:
         return dt
-    if mode == "next_monday":
-        while d.weekday() != 0:
-            d += timedelta(days=1)
-        return dt.replace(year=d.year, month=d.month, day=d.day)
-    if mode == "next_business_day":
-        d2 = next_business_day(d)
-        return dt.replace(year=d2.year, month=d2.month, day=d2.day)
-    return dt
-
-def _excluded(dt: datetime, rule: IRRule, tzinfo: ZoneInfo) -> bool:
+    # Shift by a whole number of days in one addition; wall-clock time is kept.
+    days = shift_days[dt.weekday()]
+    return dt + timedelta(days=days) if days else dt
+
+@dataclass(frozen=True)
+class _RuleFilter:
+    # Filter data of one rule, flattened once per lookup: excepted weekdays
+    # as a bitmask, exception dates as a set of day ordinals (no date() per
+    # check), the hourly window as minutes of the day, the weekend shift as
+    # a day-offset table.
+    window_minutes: Optional[Tuple[int, int]]
+    shift_days: Optional[Tuple[int, ...]]
+    except_weekday_mask: int
+    except_ordinals: FrozenSet[int]
+
+def _prep_rule(rule: IRRule) -> _RuleFilter:
+    window_minutes = None
     # hourly filter window (HOURLY + between_time only)
     if rule.type == "rrule" and rule.freq == "hourly" and rule.between_time and rule.step is None:
-        t = dt.timetz().replace(tzinfo=None)
-        if not (rule.between_time.start <= t <= rule.between_time.end):
-            return True
-
-    if dt.weekday() in rule.except_.weekdays:
+        start, end = rule.between_time.start, rule.between_time.end
+        window_minutes = (start.hour * 60 + start.minute, end.hour * 60 + end.minute)
+    return _RuleFilter(
+        window_minutes=window_minutes,
+        shift_days=_WEEKEND_SHIFT_DAYS.get(rule.weekend_shift),
+        except_weekday_mask=sum(1 << wd for wd in set(rule.except_.weekdays)),
+        except_ordinals=frozenset(d.toordinal() for d in rule.except_.dates),
+    )
+
+def _excluded(dt: datetime, prep: _RuleFilter) -> bool:
+    # rrule candidates are minute-aligned, so minutes of the day suffice
+    window = prep.window_minutes
+    if window is not None and not (window[0] <= dt.hour * 60 + dt.minute <= window[1]):
         return True
-    if dt.date() in rule.except_.dates:
+    if (prep.except_weekday_mask >> dt.weekday()) & 1:
+        return True
+    if prep.except_ordinals and dt.toordinal() in prep.except_ordinals:
         return True
-
-    # Not used in your tests; keep explicit to avoid silent wrong behavior.
-    if rule.except_.holidays.enabled:
-        raise RuntimeError("Public holidays exclusion not implemented (plug holidays here).")
-
     return False
 
-def _build_rruleset(rule: IRRule, tzinfo: ZoneInfo, now: datetime, w_start: Optional[datetime]) -> rruleset:
-    rs = rruleset()
-    dtstart = (w_start or now).replace(second=0, microsecond=0)
+# Local midnights by day ordinal: probes that jump to the next day reuse the
+# same datetime instead of building a new one on every rejection.
+@lru_cache(maxsize=1024)
+def _midnight(ordinal: int, tzinfo: Optional[tzinfo_base]) -> datetime:
+    d = date.fromordinal(ordinal)
+    return datetime(d.year, d.month, d.day, tzinfo=tzinfo)
+
+def _probe_after_rejection(dt: datetime, prep: _RuleFilter) -> datetime:
+    # Skip every occurrence that is bound to be rejected for the same reason
+    # instead of stepping through them one by one. Days and windows are those
+    # of dt's own wall clock, which is what _excluded() looked at.
+    tzinfo = dt.tzinfo
+    probe = dt + timedelta(seconds=1)
+
+    # An excluded day rejects everything up to the next midnight (weekend
+    # shifts only ever move candidates forward onto that same day).
+    if (prep.except_weekday_mask >> dt.weekday()) & 1 or dt.toordinal() in prep.except_ordinals:
+        probe = _midnight(dt.toordinal() + 1, tzinfo) - timedelta(seconds=1)
+
+    # Outside the hourly window, everything up to the next window opening.
+    if prep.window_minutes is not None:
+        start, end = prep.window_minutes
+        minutes = dt.hour * 60 + dt.minute
+        if minutes < start or minutes > end:
+            day = dt.toordinal() if minutes < start else dt.toordinal() + 1
+            opening = _midnight(day, tzinfo) + timedelta(minutes=start, seconds=-1)
+            probe = max(probe, opening)
+
+    return probe
+
+def _build_rrules(rule: IRRule, now: datetime, w_start: Optional[datetime]) -> Tuple[rrule, ...]:
+    base = w_start or now
+    year, month, day, hour, minute = base.year, base.month, base.day, base.hour, base.minute
 
     # Anchor nth weekday monthly/yearly to period start to avoid "first monday after now" bug.
     if rule.freq in {"monthly", "yearly"} and rule.bysetpos and rule.byweekday:
+        # A window start far in the past would leave the anchor far behind now:
+        # move it forward to the interval-aligned period holding now instead,
+        # with now read in the zone the anchor fields come from.
+        local_now = now.astimezone(base.tzinfo)
+        day, hour, minute = 1, 0, 0
         if rule.freq == "monthly":
-            dtstart = dtstart.replace(day=1, hour=0, minute=0)
+            months = (local_now.year - year) * 12 + (local_now.month - month)
+            if months > 0:
+                years, month0 = divmod(month - 1 + months // rule.interval * rule.interval, 12)
+                year, month = year + years, month0 + 1
         else:
-            dtstart = dtstart.replace(month=1, day=1, hour=0, minute=0)
+            month = 1
+            years = local_now.year - year
+            if years > 0:
+                year += years // rule.interval * rule.interval
+
+    # Only step rules and rules without times start at base's own time; the
+    # others only need its day, so they share their rrules for the whole day.
+    steps = rule.step is not None and rule.between_time is not None and rule.freq == "daily"
+    if not steps and (rule.times or rule.freq == "daily"):
+        hour = minute = 0
+    return _rrules_at(rule, year, month, day, hour, minute, base.tzinfo, base.fold)
+
+# The rrules of a rule only depend on the rule and its dtstart, and rrule
+# objects are never mutated once built: reuse them across calls.
+@lru_cache(maxsize=1024)
+def _rrules_at(rule: IRRule, year: int, month: int, day: int, hour: int, minute: int,
+               base_tz: Optional[tzinfo_base], fold: int) -> Tuple[rrule, ...]:
+    rules: List[rrule] = []
+
+    # dtstart is assembled from plain ints and built once per rrule, instead
+    # of chaining replace() calls that each allocate a datetime.
+    def at(h: int, m: int) -> datetime:
+        return datetime(year, month, day, h, m, tzinfo=base_tz, fold=fold)
 
     freq_const = FREQ_MAP[rule.freq]  # type: ignore
+    byweekday = tuple(IDX_TO_DU[i] for i in rule.byweekday) if rule.byweekday else None
 
-    def add_rr(dt0: datetime, hour: Optional[int] = None, minute: Optional[int] = None) -> None:
-        rs.rrule(
+    def add_rr(dt0: datetime, hour: Union[int, List[int], None] = None, minute: Union[int, List[int], None] = None) -> None:
+        rules.append(
             rrule(
                 freq=freq_const,
                 interval=rule.interval,
                 dtstart=dt0,
                 bymonth=rule.bymonth,
-                byweekday=[IDX_TO_DU[i] for i in rule.byweekday] if rule.byweekday else None,
+                byweekday=byweekday,
                 bymonthday=rule.bymonthday,
                 bysetpos=rule.bysetpos,
                 byhour=hour,
@@ -130,19 +224,60 @@ def _build_rruleset(rule: IRRule, tzinfo: ZoneInfo, now: datetime, w_start: Opti
 
     # Step-within-day: base DAILY, expanded later
     if rule.step is not None and rule.between_time is not None and rule.freq == "daily":
-        add_rr(dtstart)
-        return rs
+        add_rr(at(hour, minute))
+        return tuple(rules)
+
+    # Several times that form a full hours x minutes grid: a single rrule
+    # expands them all (from DAILY up), no merge needed
+    if len(rule.times) > 1 and rule.freq not in {"minutely", "hourly"}:
+        hours = sorted({t.hour for t in rule.times})
+        minutes = sorted({t.minute for t in rule.times})
+        if len(hours) * len(minutes) == len({(t.hour, t.minute) for t in rule.times}):
+            add_rr(at(0, 0), hour=hours, minute=minutes)
+            return tuple(rules)
 
     # Normal rules: 1 rrule per time
     if rule.times:
         for t in rule.times:
-            add_rr(dtstart.replace(hour=t.hour, minute=t.minute), hour=t.hour, minute=t.minute)
+            add_rr(at(t.hour, t.minute), hour=t.hour, minute=t.minute)
+    elif rule.freq == "daily":
+        add_rr(at(0, 0))
     else:
-        if rule.freq == "daily":
-            dtstart = dtstart.replace(hour=0, minute=0)
-        add_rr(dtstart)
-
-    return rs
+        add_rr(at(hour, minute))
+
+    return tuple(rules)
+
+@dataclass(frozen=True)
+class _YearlyDate:
+    # "every year on MM-DD at HH:MM": each year's occurrences are that date at
+    # the given times, so they are built directly instead of through rrule.
+    month: int
+    day: int
+    times: Tuple[Tuple[int, int], ...]
+    tzinfo: Optional[tzinfo_base]
+
+    def xafter(self, dt: datetime, inc: bool = False) -> Iterator[datetime]:
+        # Earlier local years are entirely before dt; years without the date
+        # (02-29) have no occurrence, as in rrule.
+        year = dt.astimezone(self.tzinfo).year
+        while year <= MAXYEAR:
+            if self.day <= monthrange(year, self.month)[1]:
+                for hour, minute in self.times:
+                    cand = datetime(year, self.month, self.day, hour, minute, tzinfo=self.tzinfo)
+                    if cand > dt or (inc and cand == dt):
+                        yield cand
+            year += 1
+
+def _yearly_date(rule: IRRule, base_tz: Optional[tzinfo_base]) -> Optional[_YearlyDate]:
+    if not (
+        rule.freq == "yearly" and rule.interval == 1 and rule.times and rule.step is None
+        and rule.bymonth and len(rule.bymonth) == 1
+        and rule.bymonthday and len(rule.bymonthday) == 1 and rule.bymonthday[0] >= 1
+        and not rule.bysetpos and not rule.byweekday
+    ):
+        return None
+    times = tuple(sorted({(t.hour, t.minute) for t in rule.times}))
+    return _YearlyDate(rule.bymonth[0], rule.bymonthday[0], times, base_tz)
 
 def _step_to_timedelta(step: IRStep) -> timedelta:
     if step.hours is not None:
@@ -151,98 +286,179 @@ def _step_to_timedelta(step: IRStep) -> timedelta:
         return timedelta(minutes=step.minutes)
     raise ValueError("Invalid step: missing hours/minutes")
 
-def _expand_step_within_day(base_dt: datetime, rule: IRRule, tzinfo: ZoneInfo, after_dt: datetime) -> Optional[datetime]:
+# First slot of start_min, start_min + step_min, ... (minutes of the day)
+# strictly after after_min, or -1 when none is left before end_min.
+def _step_minutes(start_min: int, end_min: int, step_min: int, after_min: int) -> int:
+    cur = start_min
+    if after_min >= cur:
+        cur += ((after_min - cur) // step_min + 1) * step_min
+    return cur if cur <= end_min else -1
+
+def _expand_step_within_day(bases: Iterator[datetime], rule: IRRule, tzinfo: ZoneInfo, after_dt: datetime) -> Iterator[datetime]:
+    # Every slot of every base day, in order: the day's slots are stepped
+    # through directly instead of probing the rrule again for each one.
+    # Slots are plain minutes of the day, added to the day's midnight.
     assert rule.step and rule.between_time
-    step = _step_to_timedelta(rule.step)
-
-    d = base_dt.date()
-    cur = _combine_datetime(d, rule.between_time.start, tzinfo)
-    end_dt = _combine_datetime(d, rule.between_time.end, tzinfo)
-
-    while cur <= end_dt:
-        if cur > after_dt:
-            return cur
-        cur += step
-    return None
-
-def next_occurrence(text: str, now: Optional[datetime] = None, default_tz: str = "Europe/Paris") -> datetime:
-    sched: IRSchedule = parse_schedule(text, default_tz=default_tz)
-    tzinfo = ZoneInfo(sched.tz)
+    step_min = _step_to_timedelta(rule.step) // timedelta(minutes=1)
+    start, end = rule.between_time.start, rule.between_time.end
+    start_min = start.hour * 60 + start.minute
+    end_min = end.hour * 60 + end.minute
+    if start_min > end_min:
+        return
+
+    after_dt = after_dt.astimezone(tzinfo)
+    after_day = after_dt.toordinal()
+    after_min = after_dt.hour * 60 + after_dt.minute
+
+    for base_dt in bases:
+        day = base_dt.toordinal()
+        if day < after_day:
+            continue
+        first = _step_minutes(start_min, end_min, step_min, after_min) if day == after_day else start_min
+        if first < 0:
+            continue
+        midnight = _midnight(day, tzinfo)
+        for minute in range(first, end_min + 1, step_min):
+            yield midnight + timedelta(minutes=minute)
+
+# Bump when the IR layout changes so stale precompiled files are ignored.
+_PRECOMPILED_VERSION = "3"
+
+_precompiled: Dict[Tuple[str, str, str], IRSchedule] = {}
+
+def _precompiled_key(text: str, default_tz: str) -> Tuple[str, str, str]:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest(), default_tz, _PRECOMPILED_VERSION
+
+# Precompiled IR first, then the parser's memoized parse; the engine only
+# reads the IR, so both are shared between calls.
+def _parse_cached(text: str, default_tz: str) -> IRSchedule:
+    if _precompiled:
+        sched = _precompiled.get(_precompiled_key(text, default_tz))
+        if sched is not None:
+            return sched
+    return _parse_schedule_cached(text, default_tz)
+
+# Parse rules once and pickle their IR to path, for load_precompiled().
+def precompile(rules: Iterable[str], path: str, default_tz: str = "Europe/Paris") -> None:
+    data = {_precompiled_key(text, default_tz): parse_schedule(text, default_tz=default_tz) for text in rules}
+    with open(path, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Load IR written by precompile() so those rules skip parsing; returns the
+# number of schedules loaded. The file is unpickled: only load trusted files.
+def load_precompiled(path: str) -> int:
+    with open(path, "rb") as f:
+        data = pickle.load(f)
+    loaded = {key: sched for key, sched in data.items() if key[2] == _PRECOMPILED_VERSION}
+    _precompiled.update(loaded)
+    return len(loaded)
+
+def _occurrences_from(rules: Sequence[Union[rrule, _YearlyDate]], r: IRRule, tzinfo: ZoneInfo, probe: datetime) -> Iterator[datetime]:
+    # Step-within-day bases are whole days, starting with probe's own day,
+    # expanded into their slots.
+    if r.step and r.between_time:
+        bases = rules[0].xafter(probe.replace(hour=0, minute=0, second=0, microsecond=0), inc=True)
+        return _expand_step_within_day(bases, r, tzinfo, after_dt=probe)
+    streams = [rr.xafter(probe) for rr in rules]
+    # Several rrules (one per time) are merged lazily; a lone one is used as is.
+    return streams[0] if len(streams) == 1 else merge(*streams)
+
+def _resolve(text: str, now: Optional[datetime], default_tz: str) -> Tuple[IRSchedule, ZoneInfo, datetime]:
+    # Shared entry of next_occurrence and validate: one parse, one tzinfo.
+    sched = _parse_cached(text, default_tz)
+    tzinfo = _zi(sched.tz)
 
     now = now or datetime.now(tzinfo)
     if now.tzinfo is None:
         now = now.replace(tzinfo=tzinfo)
 
-    candidates: List[datetime] = []
+    return sched, tzinfo, now
 
-    for r in sched.rules:
-        w_start, w_end = _window_datetimes(r.window_date, tzinfo)
-
-        # oneshot
-        if r.type == "oneshot":
-            dt = r.at
-            assert dt is not None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=tzinfo)
-            if dt > now and not _excluded(dt, r, tzinfo):
-                candidates.append(dt)
+def next_occurrence(text: str, now: Optional[datetime] = None, default_tz: str = "Europe/Paris") -> datetime:
+    sched, tzinfo, now = _resolve(text, now, default_tz)
+    return _next_from_sched(sched, now, tzinfo)
+
+def _rule_candidates(r: IRRule, now: datetime, tzinfo: ZoneInfo) -> Iterator[datetime]:
+    # Valid occurrences of one rule after now, in ascending order. Each one
+    # gets a budget of 500 rejected probes.
+    w_start, w_end = _window_datetimes(r.window_date, tzinfo)
+    prep = _prep_rule(r)
+
+    # Candidates, w_start and w_end all carry w_start's tzinfo when there is a
+    # window: give now the same one, so the loop's comparisons are plain field
+    # comparisons instead of utcoffset() lookups on both sides.
+    if w_start is not None and now.tzinfo is not w_start.tzinfo:
+        now = now.astimezone(w_start.tzinfo)
+
+    # oneshot
+    if r.type == "oneshot":
+        dt = r.at
+        assert dt is not None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tzinfo)
+        if dt > now and not _excluded(dt, prep):
+            yield dt
+        return
+
+    yearly_date = _yearly_date(r, (w_start or now).tzinfo)
+    rules: Sequence[Union[rrule, _YearlyDate]] = (yearly_date,) if yearly_date else _build_rrules(r, now, w_start)
+
+    # One forward iterator serves every retry: rejected candidates only
+    # ever move the probe forward, so the iterator never has to rewind.
+    probe = now
+    occurrences = _occurrences_from(rules, r, tzinfo, probe)
+    base = next(occurrences, None)
+    attempts = 0
+    while attempts < 500:
+        attempts += 1
+        if base is not None and base <= probe:
+            base = next(occurrences, None)
+            if base is not None and base <= probe:
+                # probe jumped ahead (weekend shift, window start): restart there
+                occurrences = _occurrences_from(rules, r, tzinfo, probe)
+                base = next(occurrences, None)
+        if base is None:
+            return
+
+        dt = _apply_weekend_shift(base, prep.shift_days)
+
+        if w_start and dt < w_start:
+            probe = w_start - timedelta(seconds=1)
             continue
+        if w_end and dt > w_end:
+            return
 
-        rs = _build_rruleset(r, tzinfo, now, w_start)
-
-        probe = now
-        for _ in range(500):
-            base = rs.after(probe, inc=False)
-            if base is None:
-                break
-
-            dt = base
-
-            # Step-within-day
-            if r.step and r.between_time:
-                # If rrule jumped to next day, try same-day base once.
-                if dt.date() != probe.date():
-                    day_probe = probe.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(seconds=1)
-                    base_today = rs.after(day_probe, inc=False)
-                    if base_today is not None and base_today.date() == probe.date():
-                        dt = base_today
-
-                dt2 = _expand_step_within_day(dt, r, tzinfo, after_dt=probe)
-                if dt2 is None:
-                    next_day = dt.date() + timedelta(days=1)
-                    probe = datetime(next_day.year, next_day.month, next_day.day, 0, 0, 0, tzinfo=tzinfo)
-                    continue
-                dt = dt2
-
-            dt = _apply_weekend_shift(dt, r.weekend_shift)
-
-            if w_start and dt < w_start:
-                probe = w_start - timedelta(seconds=1)
-                continue
-            if w_end and dt > w_end:
-                break
+        if _excluded(dt, prep):
+            probe = _probe_after_rejection(dt, prep)
+            continue
 
-            if _excluded(dt, r, tzinfo):
-                probe = dt + timedelta(seconds=1)
-                continue
+        yield dt
+        probe = dt
+        attempts = 0
 
-            candidates.append(dt)
-            break
+def _next_from_sched(sched: IRSchedule, now: datetime, tzinfo: ZoneInfo) -> datetime:
+    # Checked once per schedule rather than per candidate; keep explicit to
+    # avoid silent wrong behavior.
+    if any(r.except_.holidays.enabled for r in sched.rules):
+        raise RuntimeError("Public holidays exclusion not implemented (plug holidays here).")
 
-    if not candidates:
+    # Lazy merge of the per-rule streams: the first value out is the earliest
+    # valid occurrence across all rules.
+    merged = merge(*(_rule_candidates(r, now, tzinfo) for r in sched.rules))
+    first = next(merged, None)
+    if first is None:
         raise RuntimeError("No next occurrence found (rules ended or filtered out).")
 
-    return min(candidates)
+    return first
 
 def validate(rule_text: str, now: Optional[datetime] = None, default_tz: str = "Europe/Paris") -> None:
-    sched: IRSchedule = parse_schedule(rule_text, default_tz=default_tz)
-    tzinfo = ZoneInfo(sched.tz)
-
-    now = now or datetime.now(tzinfo)
-    if now.tzinfo is None:
-        now = now.replace(tzinfo=tzinfo)
+    sched, tzinfo, now = _resolve(rule_text, now, default_tz)
     now = now.replace(second=0, microsecond=0)
 
+    # The schedule's next occurrence does not depend on the rule being checked:
+    # compute it at most once.
+    next_dt: Optional[datetime] = None
+
     for r in sched.rules:
         w_start, w_end = _window_datetimes(r.window_date, tzinfo)
         if w_start and w_end and w_end < w_start:
@@ -254,9 +470,10 @@ def validate(rule_text: str, now: Optional[datetime] = None, default_tz: str = "
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=tzinfo)
 
-            if dt.weekday() in r.except_.weekdays:
+            prep = _prep_rule(r)
+            if (prep.except_weekday_mask >> dt.weekday()) & 1:
                 raise InvalidRuleError(f"One-shot excluded by weekday exception for rule '{rule_text}'")
-            if dt.date() in r.except_.dates:
+            if dt.toordinal() in prep.except_ordinals:
                 raise InvalidRuleError(f"One-shot excluded by date exception for rule '{rule_text}'")
             if w_start and dt < w_start:
                 raise InvalidRuleError(f"One-shot before window start for rule '{rule_text}'")
@@ -265,10 +482,11 @@ def validate(rule_text: str, now: Optional[datetime] = None, default_tz: str = "
             continue
 
         horizon_end = w_end or (now + timedelta(days=366))
-        try:
-            dt = next_occurrence(rule_text, now=now, default_tz=default_tz)
-        except RuntimeError:
-            raise InvalidRuleError(f"No occurrence exists in horizon for rule '{rule_text}'")
+        if next_dt is None:
+            try:
+                next_dt = _next_from_sched(sched, now, tzinfo)
+            except RuntimeError:
+                raise InvalidRuleError(f"No occurrence exists in horizon for rule '{rule_text}'")
 
-        if dt > horizon_end:
+        if next_dt > horizon_end:
             raise InvalidRuleError(f"No occurrence exists in horizon for rule '{rule_text}'")
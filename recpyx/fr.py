@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from . import en
 
+try:  # optional: RE2 matches the large fused alternation in linear time (DFA)
+    import re2 as _re_fused
+except ImportError:  # pragma: no cover - depends on the environment
+    _re_fused = re
+
 # FR -> IR.
 # Strategy: normalize French surface forms into the supported EN grammar,
 # then reuse the proven EN->IR parser.
@@ -46,6 +52,129 @@ _FR_MONTH_ORD = [
 
 _TIME_H_RE = re.compile(r"(?<!\d)(\d{1,2})h(?:(\d{2}))?(?!\d)", re.I)
 
+_APOS_TABLE = str.maketrans({"’": "'"})
+
+# fr_to_en_rule rewrites, compiled once at import (in pipeline order)
+_TZ_SUFFIX_RE = re.compile(r"\(([^)]+/[^)]+)\)\s*$")
+_A_GRAVE_RE = re.compile(r"\bà\b")
+_ET_COMPOSED_RE = re.compile(r"\s*,\s*et\s+", re.I)
+_ENTRE_DATES_RE = re.compile(
+    r"\bentre\s+le\s+(\d{4}-\d{2}-\d{2})\s+et\s+le\s+(\d{4}-\d{2}-\d{2})\b", re.I
+)
+_ENTRE_TIMES_RE = re.compile(r"\bentre\s+(\d{2}:\d{2})\s+et\s+(\d{2}:\d{2})\b", re.I)
+_JUSQU_AU_RE = re.compile(r"\bjusqu\'?au\s+(\d{4}-\d{2}-\d{2})\b", re.I)
+_WEEKEND_MONDAY_RE = re.compile(r"\bsi\s+week-?end\s+alors\s+lundi\s+suivant\b", re.I)
+_WEEKEND_BUSINESS_RE = re.compile(
+    r"\bsi\s+week-?end\s+alors\s+prochain\s+jour\s+ouvr[eé]\b", re.I
+)
+_COMMA_BEFORE_SHIFT_RE = re.compile(
+    r",\s*(if\s+weekend\s+then\s+next\s+(?:monday|business\s+day))\b", re.I
+)
+_TRAILING_COMMA_RE = re.compile(r",\s*$")
+
+# Plain word swaps, applied in a single scan: one alternation (longest
+# first) and a lookup on the lowercased match. The pattern text is shared by
+# both engines, hence the inline (?i) instead of a flags argument.
+_FR_WORDS = {
+    "tous les": "every",
+    "toutes les": "every",
+    "chaque": "every",
+    "jour ouvrés": "weekday",
+    "jour ouvres": "weekday",
+    "jours ouvrés": "weekday",
+    "jours ouvres": "weekday",
+    "jours": "days",
+    "jour": "day",
+    "semaines": "weeks",
+    "semaine": "week",
+    "heures": "hours",
+    "heure": "hour",
+    "minutes": "minutes",
+    "minute": "minute",
+    "mois": "month",
+    "ans": "years",
+    "an": "year",
+    "1er": "1st",
+    # nth weekday in month: "le premier lundi" -> "le first monday"
+    **dict(_FR_MONTH_ORD),
+    "lundis": "monday",
+    "lundi": "monday",
+    "mardis": "tuesday",
+    "mardi": "tuesday",
+    "mercredis": "wednesday",
+    "mercredi": "wednesday",
+    "jeudis": "thursday",
+    "jeudi": "thursday",
+    "vendredis": "friday",
+    "vendredi": "friday",
+    "samedis": "saturday",
+    "samedi": "saturday",
+    "dimanches": "sunday",
+    "dimanche": "sunday",
+}
+_FR_WORDS_PATTERN = (
+    r"(?i)\b(?:" + "|".join(re.escape(w) for w in sorted(_FR_WORDS, key=len, reverse=True)) + r")\b"
+)
+_FR_WORDS_RE = _re_fused.compile(_FR_WORDS_PATTERN)
+
+# french months (for yearly "of <month>")
+_FR_MONTHS = {
+    "janvier": "january",
+    "février": "february",
+    "fevrier": "february",
+    "mars": "march",
+    "avril": "april",
+    "mai": "may",
+    "juin": "june",
+    "juillet": "july",
+    "août": "august",
+    "aout": "august",
+    "septembre": "september",
+    "octobre": "october",
+    "novembre": "november",
+    "décembre": "december",
+    "decembre": "december",
+}
+_FR_MONTHS_ALT = "|".join(sorted(_FR_MONTHS, key=len, reverse=True))
+_MONTH_OF_RE = re.compile(rf"\b(?:d[\\'’]|de\s+)({_FR_MONTHS_ALT})\b", re.I)
+_MONTH_AND_RE = re.compile(rf"\band\s+({_FR_MONTHS_ALT})\b", re.I)
+
+# fix plural artefacts
+_PLURAL_RES = [
+    (re.compile(r"\bevery\s+days\b", re.I), "every day"),
+    (re.compile(r"\bevery\s+weekdays\b", re.I), "every weekday"),
+    (re.compile(r"\bevery\s+hours\b", re.I), "every hour"),
+    (re.compile(r"\bevery\s+minutes\b", re.I), "every minute"),
+    (re.compile(r"\bevery\s+weeks\b", re.I), "every week"),
+]
+_EVERY_YEARS_RE = re.compile(r"\bevery\s+years\b", re.I)
+_EVERY_ANNEE_RE = re.compile(r"\bevery\s+ann[eé]e\b", re.I)
+_YEAR_ON_ORDINAL_RE = re.compile(
+    r"\bevery\s+year\s+on\s+(first|second|third|fourth|fifth|last)\b", re.I
+)
+_ET_RE = re.compile(r"\b(et)\b", re.I)
+_SAUF_RE = re.compile(r"\bsauf\b", re.I)
+_COMMA_RE = re.compile(r"\s*,\s*")
+_STEP_WITHIN_DAY_RE = re.compile(
+    r"^(every\s+(?:day|weekday))\s*,\s*every\s+(\d+)\s+(hours|minutes)\s+between\b", re.I
+)
+_MONTH_LE_RE = re.compile(r"\bevery\s+month\s+le\b", re.I)
+_MONTH_ON_THE_RE = re.compile(r"^(every\s+month)\s+(?!on\b)", re.I)
+_YEAR_LE_RE = re.compile(r"\bevery\s+year\s+le\b", re.I)
+_YEAR_LE_DATE_RE = re.compile(
+    r"^(every\s+year)\s+le\s+(\d{2}-\d{2})\s+a\s+(\d{2}:\d{2})$", re.I
+)
+_ONESHOT_LE_RE = re.compile(r"^le\s+(\d{4}-\d{2}-\d{2})\s+a\s+(\d{2}:\d{2})$", re.I)
+_A_TIME_RE = re.compile(r"\sa\s+(\d{2}:\d{2})", re.I)
+_ONESHOT_LE_AT_RE = re.compile(r"\ble\s+(\d{4}-\d{2}-\d{2})\s+at\s+(\d{2}:\d{2})\b", re.I)
+_LE_WEEKDAY_RE = re.compile(
+    r"\ble\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b", re.I
+)
+_WEEKS_ON_RE = re.compile(
+    r"^(every\s+\d+\s+weeks)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b",
+    re.I,
+)
+
 
 def _fr_time_to_en(s: str) -> str:
     # 10h -> 10:00 ; 10h00 -> 10:00 ; 08h30 -> 08:30
@@ -58,251 +187,129 @@ def _fr_time_to_en(s: str) -> str:
 
 
 def _norm_spaces(s: str) -> str:
-    s = s.replace("’", "'")
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # str.split() collapses whitespace runs and strips both ends in one pass
+    return " ".join(s.translate(_APOS_TABLE).split())
 
 
-def _wd_fr_to_en(s: str) -> str:
-    # replace standalone weekday words (sing/plural)
-    out = s
-    for fr, en in [
-        ("lundis", "monday"),
-        ("lundi", "monday"),
-        ("mardis", "tuesday"),
-        ("mardi", "tuesday"),
-        ("mercredis", "wednesday"),
-        ("mercredi", "wednesday"),
-        ("jeudis", "thursday"),
-        ("jeudi", "thursday"),
-        ("vendredis", "friday"),
-        ("vendredi", "friday"),
-        ("samedis", "saturday"),
-        ("samedi", "saturday"),
-        ("dimanches", "sunday"),
-        ("dimanche", "sunday"),
-    ]:
-        out = re.sub(rf"\b{fr}\b", en, out, flags=re.I)
-    return out
+def _fr_words_to_en(s: str) -> str:
+    return _FR_WORDS_RE.sub(lambda m: _FR_WORDS[m.group(0).lower()], s)
 
 
+# Pure str -> str translation: memoized for callers that re-parse the same
+# rules (lru_cache is safe to share between threads).
+@lru_cache(maxsize=1024)
 def fr_to_en_rule(fr_rule: str) -> str:
     s = _norm_spaces(fr_rule)
 
     # timezone: "(Europe/Paris)" => "in Europe/Paris"
-    m = re.search(r"\(([^)]+/[^)]+)\)\s*$", s)
+    m = _TZ_SUFFIX_RE.search(s)
     tz_suffix = ""
     if m:
         tz = m.group(1).strip()
         s = s[: m.start()].strip()
         tz_suffix = f" in {tz}"
 
+    # Cheap substring guards below skip rewrites whose keyword is absent; the
+    # keywords only ever come from the input, so the original text decides.
+    low = s.lower()
+
     s = _fr_time_to_en(s)
-    s = re.sub(r"\bà\b", " a ", s)
+    if "à" in low:
+        s = _A_GRAVE_RE.sub(" a ", s)
     # do NOT split "au" (would break words like "sauf")
     s = _norm_spaces(s)
 
     # composed rules: ", et " => ", and "
-    s = re.sub(r"\s*,\s*et\s+", ", and ", s, flags=re.I)
-
-    # date windows
-    s = re.sub(
-        r"\bentre\s+le\s+(\d{4}-\d{2}-\d{2})\s+et\s+le\s+(\d{4}-\d{2}-\d{2})\b",
-        r"between \1 and \2",
-        s,
-        flags=re.I,
-    )
-    # time range: "entre 09h00 et 17h00"
-    s = re.sub(
-        r"\bentre\s+(\d{2}:\d{2})\s+et\s+(\d{2}:\d{2})\b",
-        r"between \1 and \2",
-        s,
-        flags=re.I,
-    )
-    s = re.sub(r"\bjusqu\'?au\s+(\d{4}-\d{2}-\d{2})\b", r"until \1", s, flags=re.I)
-
-    # weekend shift
-    s = re.sub(
-        r"\bsi\s+week-?end\s+alors\s+lundi\s+suivant\b",
-        "if weekend then next monday",
-        s,
-        flags=re.I,
-    )
-    s = re.sub(
-        r"\bsi\s+week-?end\s+alors\s+prochain\s+jour\s+ouvr[eé]\b",
-        "if weekend then next business day",
-        s,
-        flags=re.I,
-    )
-    # cleanup commas before suffix clauses
-    s = re.sub(
-        r",\s*(if\s+weekend\s+then\s+next\s+(?:monday|business\s+day))\b",
-        r" \1",
-        s,
-        flags=re.I,
-    )
-    s = re.sub(r",\s*$", "", s)
-
-    # frequency base phrases
-    s = re.sub(r"\b(tous|toutes)\s+les\b", "every", s, flags=re.I)
-    s = re.sub(r"\bchaque\b", "every", s, flags=re.I)
-    s = re.sub(r"\bjour\s+ouvr[eé]s\b", "weekday", s, flags=re.I)
-    s = re.sub(r"\bjours\s+ouvr[eé]s\b", "weekday", s, flags=re.I)
-    s = re.sub(r"\bjours\b", "days", s, flags=re.I)
-    s = re.sub(r"\bjour\b", "day", s, flags=re.I)
-    s = re.sub(r"\bsemaines\b", "weeks", s, flags=re.I)
-    s = re.sub(r"\bsemaine\b", "week", s, flags=re.I)
-    s = re.sub(r"\bheures\b", "hours", s, flags=re.I)
-    s = re.sub(r"\bheure\b", "hour", s, flags=re.I)
-    s = re.sub(r"\bminutes\b", "minutes", s, flags=re.I)
-    s = re.sub(r"\bminute\b", "minute", s, flags=re.I)
-
-    # fix plural artefacts
-    s = re.sub(r"\bevery\s+days\b", "every day", s, flags=re.I)
-    s = re.sub(r"\bevery\s+weekdays\b", "every weekday", s, flags=re.I)
-    s = re.sub(r"\bevery\s+hours\b", "every hour", s, flags=re.I)
-    s = re.sub(r"\bevery\s+minutes\b", "every minute", s, flags=re.I)
-    s = re.sub(r"\bevery\s+weeks\b", "every week", s, flags=re.I)
-
-    # months / years
-    s = re.sub(r"\bmois\b", "month", s, flags=re.I)
-    s = re.sub(r"\bans\b", "years", s, flags=re.I)
-    s = re.sub(r"\ban\b", "year", s, flags=re.I)
+    if "," in low:
+        s = _ET_COMPOSED_RE.sub(", and ", s)
+
+    if "entre" in low:
+        # date windows
+        s = _ENTRE_DATES_RE.sub(r"between \1 and \2", s)
+        # time range: "entre 09h00 et 17h00"
+        s = _ENTRE_TIMES_RE.sub(r"between \1 and \2", s)
+    if "jusqu" in low:
+        s = _JUSQU_AU_RE.sub(r"until \1", s)
+
+    if "week" in low:
+        # weekend shift
+        s = _WEEKEND_MONDAY_RE.sub("if weekend then next monday", s)
+        s = _WEEKEND_BUSINESS_RE.sub("if weekend then next business day", s)
+        # cleanup commas before suffix clauses
+        s = _COMMA_BEFORE_SHIFT_RE.sub(r" \1", s)
+    if "," in low:
+        s = _TRAILING_COMMA_RE.sub("", s)
+
+    # frequency base phrases, units, months/years, "1er" -> "1st", ordinals
+    # ("dernier jour" -> "last day"), weekdays
+    s = _fr_words_to_en(s)
+
+    for pat, en in _PLURAL_RES:
+        s = pat.sub(en, s)
 
     # singularize after FR->EN unit replacements
-    s = re.sub(r"\bevery\s+years\b", "every year", s, flags=re.I)
-    s = re.sub(r"\bevery\s+ann[eé]e\b", "every year", s, flags=re.I)
-
-    # ordinal day-of-month: "1er" -> "1st"
-    s = re.sub(r"\b1er\b", "1st", s, flags=re.I)
-
-    # "dernier jour" -> "last day"
-    s = re.sub(r"\bdernier\s+jour\b", "last day", s, flags=re.I)
-
-    # nth weekday in month: "le premier lundi" -> "the first monday"
-    for fr, en in _FR_MONTH_ORD:
-        s = re.sub(rf"\b{re.escape(fr)}\b", en, s, flags=re.I)
-
-    # weekdays
-    s = _wd_fr_to_en(s)
-
-    # french months (for yearly "of <month>")
-    month_map = {
-        "janvier": "january",
-        "février": "february",
-        "fevrier": "february",
-        "mars": "march",
-        "avril": "april",
-        "mai": "may",
-        "juin": "june",
-        "juillet": "july",
-        "août": "august",
-        "aout": "august",
-        "septembre": "september",
-        "octobre": "october",
-        "novembre": "november",
-        "décembre": "december",
-        "decembre": "december",
-    }
-    for fr_m, en_m in month_map.items():
-        s = re.sub(rf"\bd[\\'’]{fr_m}\b", f"of {en_m}", s, flags=re.I)
-        s = re.sub(rf"\bde\s+{fr_m}\b", f"of {en_m}", s, flags=re.I)
-
-    # french months with "and" connector: "de mars et octobre" -> "of march and october"
-    for fr_m, en_m in month_map.items():
-        s = re.sub(rf"\bde\s+{fr_m}\s+et\s+", f"of {en_m} and ", s, flags=re.I)
+    s = _EVERY_YEARS_RE.sub("every year", s)
+    s = _EVERY_ANNEE_RE.sub("every year", s)
+
+    has_month = any(fr_m in low for fr_m in _FR_MONTHS)
+
+    # french months: "d'octobre" / "de mars" -> "of october" / "of march"
+    if has_month:
+        s = _MONTH_OF_RE.sub(lambda m: f"of {_FR_MONTHS[m.group(1).lower()]}", s)
 
     # ensure "every year on the <ordinal> <weekday> of <month>"
-    s = re.sub(
-        r"\bevery\s+year\s+on\s+(first|second|third|fourth|fifth|last)\b",
-        r"every year on the \1",
-        s,
-        flags=re.I,
-    )
+    s = _YEAR_ON_ORDINAL_RE.sub(r"every year on the \1", s)
 
     # connectors: "et" between weekdays / times -> "and"
-    s = re.sub(r"\b(et)\b", "and", s, flags=re.I)
+    if "et" in low:
+        s = _ET_RE.sub("and", s)
 
     # convert remaining french months that follow "and"
-    for fr_m, en_m in month_map.items():
-        s = re.sub(rf"\band\s+{fr_m}\b", f"and {en_m}", s, flags=re.I)
+    if has_month:
+        s = _MONTH_AND_RE.sub(lambda m: f"and {_FR_MONTHS[m.group(1).lower()]}", s)
 
     # "sauf" -> "except"
-    s = re.sub(r"\bsauf\b", "except", s, flags=re.I)
+    if "sauf" in low:
+        s = _SAUF_RE.sub("except", s)
 
     # normalize commas
-    s = re.sub(r"\s*,\s*", ", ", s)
+    s = _COMMA_RE.sub(", ", s)
     s = _norm_spaces(s)
 
     # Handle special patterns:
     # - "every day, every 2 hours between ..." -> "every day every 2 hours between ..."
-    s = re.sub(
-        r"^(every\s+(?:day|weekday))\s*,\s*every\s+(\d+)\s+(hours|minutes)\s+between\b",
-        r"\1 every \2 \3 between",
-        s,
-        flags=re.I,
-    )
+    s = _STEP_WITHIN_DAY_RE.sub(r"\1 every \2 \3 between", s)
 
     # - "every month le X ..." -> "every month on the X ..."
-    s = re.sub(r"\bevery\s+month\s+le\b", "every month on the", s, flags=re.I)
+    s = _MONTH_LE_RE.sub("every month on the", s)
 
     # ensure "every month" has "on the"
-    s = re.sub(r"^(every\s+month)\s+(?!on\b)", r"\1 on the ", s, flags=re.I)
+    s = _MONTH_ON_THE_RE.sub(r"\1 on the ", s)
 
     # yearly forms:
-    s = re.sub(r"\bevery\s+year\s+le\b", "every year on", s, flags=re.I)
+    s = _YEAR_LE_RE.sub("every year on", s)
 
     # "every year le 03-12 a 12:30" -> "every year on 03-12 at 12:30"
-    s = re.sub(
-        r"^(every\s+year)\s+le\s+(\d{2}-\d{2})\s+a\s+(\d{2}:\d{2})$",
-        r"\1 on \2 at \3",
-        s,
-        flags=re.I,
-    )
+    s = _YEAR_LE_DATE_RE.sub(r"\1 on \2 at \3", s)
 
     # one-shot: "le 2026-03-13 a 02:00" -> "2026-03-13 at 02:00"
-    s = re.sub(
-        r"^le\s+(\d{4}-\d{2}-\d{2})\s+a\s+(\d{2}:\d{2})$",
-        r"\1 at \2",
-        s,
-        flags=re.I,
-    )
+    s = _ONESHOT_LE_RE.sub(r"\1 at \2", s)
 
     # generic: " a " -> " at "
-    s = re.sub(r"\sa\s+(\d{2}:\d{2})", r" at \1", s, flags=re.I)
+    s = _A_TIME_RE.sub(r" at \1", s)
 
     # one-shot: remove leading "le" even inside composed schedules
-    s = re.sub(
-        r"\ble\s+(\d{4}-\d{2}-\d{2})\s+at\s+(\d{2}:\d{2})\b",
-        r"\1 at \2",
-        s,
-        flags=re.I,
-    )
+    s = _ONESHOT_LE_AT_RE.sub(r"\1 at \2", s)
 
     # "le monday" after conversions: remove "le" when it remains
-    s = re.sub(
-        r"\ble\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b",
-        r"\1",
-        s,
-        flags=re.I,
-    )
+    s = _LE_WEEKDAY_RE.sub(r"\1", s)
 
     # "every 3 weeks monday at 08:30" needs "on monday"
-    s = re.sub(
-        r"^(every\s+\d+\s+weeks)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b",
-        r"\1 on \2",
-        s,
-        flags=re.I,
-    )
+    s = _WEEKS_ON_RE.sub(r"\1 on \2", s)
 
     # final tidy
     # final fixups for yearly nth-weekday patterns
-    s = re.sub(
-        r"\bevery\s+year\s+on\s+(first|second|third|fourth|fifth|last)\b",
-        r"every year on the \1",
-        s,
-        flags=re.I,
-    )
+    s = _YEAR_ON_ORDINAL_RE.sub(r"every year on the \1", s)
 
     s = _norm_spaces(s) + tz_suffix
     return s
@@ -1,32 +1,48 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Callable
 
 from . import en, fr
 
-_FR_MARKERS = re.compile(
-    r"\b("
-    r"tous|toutes|sauf|lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche|"
-    r"ouvr[eé]s?|semaine|semaines|mois|ans|an|entre|jusqu(?:'|’)?au|week-?end|"
-    r"janvier|février|fevrier|mars|avril|mai|juin|juillet|août|aout|"
-    r"septembre|octobre|novembre|décembre|decembre"
-    r")\b",
-    re.I,
+_FR_WORDS = (
+    "tous", "toutes", "sauf", "lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche",
+    "ouvr[eé]s?", "semaine", "semaines", "mois", "ans", "an", "entre", "jusqu(?:'|’)?au", "week-?end",
+    "janvier", "février", "fevrier", "mars", "avril", "mai", "juin", "juillet", "août", "aout",
+    "septembre", "octobre", "novembre", "décembre", "decembre",
+)
+_EN_WORDS = (
+    "every", "except", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "weekday", "weekend", "between", "until", "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
 )
-_EN_MARKERS = re.compile(
-    r"\b("
-    r"every|except|monday|tuesday|wednesday|thursday|friday|saturday|sunday|"
-    r"weekday|weekend|between|until|january|february|march|april|may|june|"
-    r"july|august|september|october|november|december"
-    r")\b",
+# Longest alternatives first, so a word is usually matched by the first
+# alternative tried instead of after backtracking from a shorter prefix.
+_FR_MARKERS = "|".join(sorted(_FR_WORDS, key=len, reverse=True))
+_EN_MARKERS = "|".join(sorted(_EN_WORDS, key=len, reverse=True))
+# Both marker sets in one scan; "weekend" belongs to both and counts for each.
+_LANG_MARKERS = re.compile(
+    rf"\b(?:(?P<both>weekend)|(?P<fr>{_FR_MARKERS})|(?P<en>{_EN_MARKERS}))\b",
     re.I,
 )
+# A lead this large settles the language; the rest of the text is not scanned.
+_LANG_LEAD = 3
 
 
 def detect_language(text: str) -> str:
-    fr_hits = len(_FR_MARKERS.findall(text))
-    en_hits = len(_EN_MARKERS.findall(text))
+    # English rules nearly all open with "every": no marker scan for them.
+    if text[:6].lower() == "every ":
+        return "en"
+    fr_hits = en_hits = 0
+    for m in _LANG_MARKERS.finditer(text):
+        kind = m.lastgroup
+        if kind != "en":
+            fr_hits += 1
+        if kind != "fr":
+            en_hits += 1
+        if abs(fr_hits - en_hits) >= _LANG_LEAD:
+            break
     if fr_hits > en_hits:
         return "fr"
     if en_hits > fr_hits:
@@ -41,9 +57,9 @@ def _parse_with_fallback(
     secondary: Callable[[str, str], en.IRSchedule],
 ) -> en.IRSchedule:
     try:
-        return primary(text, default_tz=default_tz)
+        return primary(text, default_tz)
     except ValueError:
-        return secondary(text, default_tz=default_tz)
+        return secondary(text, default_tz)
 
 
 def parse_schedule(text: str, default_tz: str = "Europe/Paris") -> en.IRSchedule:
@@ -53,6 +69,13 @@ def parse_schedule(text: str, default_tz: str = "Europe/Paris") -> en.IRSchedule
     return _parse_with_fallback(text, default_tz, en.parse_schedule, fr.parse_schedule)
 
 
+# Memoized parse for callers that poll the same rule texts (the engine). The
+# IR is frozen, so one parsed schedule is safely shared between calls.
+@lru_cache(maxsize=2048)
+def _parse_schedule_cached(text: str, default_tz: str) -> en.IRSchedule:
+    return parse_schedule(text, default_tz=default_tz)
+
+
 def parse_rule(text: str) -> en.IRRule:
     lang = detect_language(text)
     if lang == "fr":
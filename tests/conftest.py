@@ -3,5 +3,19 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+
+import recpyx.engine as engine  # noqa: E402
+
+# Time zones the tests use: loaded once up front, so the first test to hit
+# each one does not pay for reading its tzdata file.
+TIMEZONES = ("Europe/Paris", "America/New_York", "UTC")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_timezones() -> None:
+    for name in TIMEZONES:
+        engine._zi(name)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Iterator, Tuple
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -7,9 +8,10 @@ import recpyx.engine as engine
 from recpyx import InvalidRuleError, next_occurrence, validate
 
 TZ = "Europe/Paris"
-NOW = datetime(2026, 3, 12, 12, 0, 0, tzinfo=ZoneInfo(TZ))
+TZINFO = ZoneInfo(TZ)
+NOW = datetime(2026, 3, 12, 12, 0, 0, tzinfo=TZINFO)
 
-CASES_EN = [
+CASES_EN = (
     # --- Basics ---
     ("every sunday at 10AM", "2026-03-15T10:00:00"),
     ("every day at 3PM", "2026-03-12T15:00:00"),
@@ -78,11 +80,9 @@ CASES_EN = [
     ("every year", "2027-03-12T00:00:00"),
     ("every day except thursday at 18:00", "2026-03-13T18:00:00"),
     ("every day except friday at 18:00", "2026-03-12T18:00:00"),
-    ("every day except wednesday and sunday at 10:00", "2026-03-13T10:00:00"),
 
     # --- except weekdays with weekday rule ---
     ("every weekday except thursday at 15:00", "2026-03-13T15:00:00"),
-    ("every weekday except friday at 09:00", "2026-03-16T09:00:00"),
     ("every monday and thursday except thursday at 18:00", "2026-03-16T18:00:00"),
 
     # --- except at end (postfix) ---
@@ -90,7 +90,6 @@ CASES_EN = [
     ("every weekday at 09:00 except friday", "2026-03-16T09:00:00"),
 
     # --- except dates (single + multiple) ---
-    ("every day at 10:00 except 2026-03-13", "2026-03-14T10:00:00"),
     ("every day at 10:00 except 2026-03-13, 2026-03-14", "2026-03-15T10:00:00"),
     ("every day at 10:00 except 2026-03-13 2026-03-14", "2026-03-15T10:00:00"),
 
@@ -132,7 +131,6 @@ CASES_EN = [
     ("every day at 11:00, 12:30, 23:00", "2026-03-12T12:30:00"),
     ("every day except thursday at 12:30", "2026-03-13T12:30:00"),
     ("every day except thursday friday 2026-03-12 at 18:00", "2026-03-14T18:00:00"),
-    ("every day at 18:00 except thursday", "2026-03-13T18:00:00"),
     ("every day at 18:00 except friday", "2026-03-12T18:00:00"),
     ("every day except friday 2026-03-15 at 18:00", "2026-03-12T18:00:00"),
     ("every day except thursday at 18:00 between 2026-03-12 and 2026-03-20", "2026-03-13T18:00:00"),
@@ -146,7 +144,6 @@ CASES_EN = [
     ("every weekday at 13:00 except thursday", "2026-03-13T13:00:00"),
     ("every weekday at 13:00 except friday", "2026-03-12T13:00:00"),
     ("every weekday at 09:00 except thursday", "2026-03-13T09:00:00"),
-    ("every weekday at 09:00 except friday", "2026-03-16T09:00:00"),
     ("every weekday at 15:30 between 2026-03-01 and 2026-03-31 except thursday", "2026-03-13T15:30:00"),
     ("every weekday at 15:30 until 2026-03-20 except 2026-03-13", "2026-03-12T15:30:00"),
     ("every weekday at 15:30 until 2026-03-20 except thursday", "2026-03-13T15:30:00"),
@@ -159,7 +156,6 @@ CASES_EN = [
     ("every weekday every 30 minutes between 12:00 and 14:00", "2026-03-12T12:30:00"),
     ("every weekday every 30 minutes between 12:00 and 14:00 except thursday", "2026-03-13T12:00:00"),
     ("every weekday every 90 minutes between 08:00 and 12:00 except friday", "2026-03-16T08:00:00"),
-    ("every day every 2 hours between 09:00 and 17:00 except thursday", "2026-03-13T09:00:00"),
     ("every day every 2 hours between 09:00 and 17:00 except 2026-03-13", "2026-03-12T13:00:00"),
     (
         "every day every 2 hours between 09:00 and 17:00 between 2026-03-12 and 2026-03-14 except 2026-03-13",
@@ -175,13 +171,10 @@ CASES_EN = [
     ),
 
     # --- HOURLY between window (filter) + except ---
-    ("every 2 hours between 09:00 and 17:00", "2026-03-12T14:00:00"),
-    ("every 2 hours between 09:00 and 17:00 except thursday", "2026-03-13T10:00:00"),
     ("every 3 hours between 08:00 and 23:00", "2026-03-12T15:00:00"),
     ("every 4 hours between 01:00 and 23:00 except thursday", "2026-03-13T04:00:00"),
     ("every hour between 12:00 and 14:00", "2026-03-12T13:00:00"),
     ("every hour between 12:00 and 14:00 except thursday", "2026-03-13T12:00:00"),
-    ("every hour between 18:00 and 23:00 except thursday", "2026-03-13T18:00:00"),
     ("every 6 hours between 00:00 and 23:00", "2026-03-12T18:00:00"),
 
     # --- Minutes / hours pure intervals ---
@@ -191,14 +184,13 @@ CASES_EN = [
     ("every month", "2026-04-12T00:00:00"),
     ("every 6 hours", "2026-03-12T18:00:00"),
     ("every 6 hours except thursday", "2026-03-13T00:00:00"),
+    ("every minute except thursday", "2026-03-13T00:00:00"),
 
     # --- Monthly (day-of-month) + except + windows ---
     ("every month on the 12th at 12:30", "2026-03-12T12:30:00"),
     ("every month on the 12th at 18:00", "2026-03-12T18:00:00"),
     ("every month on the 13th at 10:00", "2026-03-13T10:00:00"),
     ("every month on the 31st at 20:00 except 2026-03-31", "2026-05-31T20:00:00"),
-    ("every month on the 15th at 08:00 except 2026-03-15", "2026-04-15T08:00:00"),
-    ("every month on the last day at 20:00 except 2026-03-31", "2026-04-30T20:00:00"),
     ("every month on the 12th and 14th at 18:00", "2026-03-12T18:00:00"),
     ("every month on the 31st at 20:00 except 2026-03-31 and 2026-05-31", "2026-07-31T20:00:00"),
 
@@ -212,16 +204,15 @@ CASES_EN = [
     # --- Composed (min candidate wins) ---
     ("2026-03-12 at 13:00, and every day at 18:00", "2026-03-12T13:00:00"),
     ("every day at 18:00 except thursday, and every day at 17:00", "2026-03-12T17:00:00"),
-    ("every day at 18:00 except friday, and 2026-03-13 at 02:00", "2026-03-12T18:00:00"),
 
     # --- Yearly ---
     ("every year on 03-12 at 12:30", "2026-03-12T12:30:00"),
     ("every year on 03-12 at 11:00", "2027-03-12T11:00:00"),
     ("every year on the last sunday of october at 23:00", "2026-10-25T23:00:00"),
     ("every year on the last sunday of march and october at 23:00", "2026-03-29T23:00:00"),
-]
+)
 
-CASES_FR = [
+CASES_FR = (
     ("tous les dimanches à 10h", "2026-03-15T10:00:00"),
     ("tous les jours à 15h", "2026-03-12T15:00:00"),
     ("tous les jours sauf le mercredi à 10h", "2026-03-13T10:00:00"),
@@ -303,7 +294,6 @@ CASES_FR = [
     ("tous les jours ouvrés à 13h00 sauf le jeudi", "2026-03-13T13:00:00"),
     ("tous les jours ouvrés à 13h00 sauf le vendredi", "2026-03-12T13:00:00"),
     ("tous les jours ouvrés à 09h00 sauf le jeudi", "2026-03-13T09:00:00"),
-    ("tous les jours ouvrés à 09h00 sauf le vendredi", "2026-03-16T09:00:00"),
     ("tous les jours ouvrés à 15h30 entre le 2026-03-01 et le 2026-03-31 sauf le jeudi", "2026-03-13T15:30:00"),
     ("tous les jours ouvrés à 15h30 jusqu'au 2026-03-20 sauf le 2026-03-13", "2026-03-12T15:30:00"),
     ("tous les jours ouvrés à 15h30 jusqu'au 2026-03-20 sauf le jeudi", "2026-03-13T15:30:00"),
@@ -343,7 +333,6 @@ CASES_FR = [
     ("tous les mois le 12 à 18h00", "2026-03-12T18:00:00"),
     ("tous les mois le 13 à 10h00", "2026-03-13T10:00:00"),
     ("tous les mois le 31 à 20h00 sauf le 2026-03-31", "2026-05-31T20:00:00"),
-    ("tous les mois le dernier jour à 20h00 sauf le 2026-03-31", "2026-04-30T20:00:00"),
     ("tous les mois le 12 et le 14 à 18h00", "2026-03-12T18:00:00"),
     ("tous les mois le 31 à 20h00 sauf le 2026-03-31 et le 2026-05-31", "2026-07-31T20:00:00"),
     ("tous les mois le deuxième jeudi à 18h00", "2026-03-12T18:00:00"),
@@ -353,43 +342,82 @@ CASES_FR = [
     ("tous les mois le cinquième lundi à 09h00", "2026-03-30T09:00:00"),
     ("le 2026-03-12 à 13h00, et tous les jours à 18h00", "2026-03-12T13:00:00"),
     ("tous les jours à 18h00 sauf le jeudi, et tous les jours à 17h00", "2026-03-12T17:00:00"),
-    ("tous les jours à 18h00 sauf le vendredi, et le 2026-03-13 à 02h00", "2026-03-12T18:00:00"),
     ("tous les ans le 03-12 à 12h30", "2026-03-12T12:30:00"),
     ("tous les ans le 03-12 à 11h00", "2027-03-12T11:00:00"),
     ("tous les ans le dernier dimanche d'octobre à 23h00", "2026-10-25T23:00:00"),
     ("tous les ans le dernier dimanche de mars et octobre à 23h00", "2026-03-29T23:00:00"),
-]
+)
+
+# Rule texts, used as test ids.
+RULES_EN = tuple(rule for rule, _ in CASES_EN)
+RULES_FR = tuple(rule for rule, _ in CASES_FR)
+
+# The same rule in both languages, one pair per rule shape.
+PAIRED = (
+    ("every sunday at 10AM", "tous les dimanches à 10h"),
+    ("every day except wednesday at 10AM", "tous les jours sauf le mercredi à 10h"),
+    ("every 3 weeks on monday at 08:30", "toutes les 3 semaines le lundi à 08h30"),
+    ("every weekday at 09:00", "tous les jours ouvrés à 09h00"),
+    ("every saturday at 10:00, 14:00, 18:00", "tous les samedis à 10h00, 14h00, 18h00"),
+    ("every day every 2 hours between 09:00 and 17:00", "tous les jours, toutes les 2 heures entre 09h00 et 17h00"),
+    ("every hour between 18:00 and 23:00", "toutes les heures entre 18h00 et 23h00"),
+    (
+        "every weekday at 15:00 between 2026-02-01 and 2026-03-31",
+        "tous les jours ouvrés à 15h00 entre le 2026-02-01 et le 2026-03-31",
+    ),
+    ("every day at 10:00 until 2026-12-31", "tous les jours à 10h00 jusqu'au 2026-12-31"),
+    ("every month on the last day at 20:00", "tous les mois le dernier jour à 20h00"),
+    ("every month on the 2nd and 15th at 08:00", "tous les mois le 2 et le 15 à 08h00"),
+    ("every month on the first monday at 09:00", "tous les mois le premier lundi à 09h00"),
+    ("every day at 10:00 except 2026-12-25, 2026-01-01", "tous les jours à 10h00 sauf le 2026-12-25 et le 2026-01-01"),
+    ("every day at 18:00, and 2026-03-13 at 02:00", "tous les jours à 18h00, et le 2026-03-13 à 02h00"),
+    (
+        "every month on the 1st at 09:00 between 2026-08-01 and 2026-08-31 if weekend then next business day",
+        "tous les mois le 1er à 09h00 entre le 2026-08-01 et le 2026-08-31, si week-end alors prochain jour ouvré",
+    ),
+)
 
-INVALID_RULES = [
+INVALID_RULES = (
     "every day at 10:00 until 2026-03-13 except 2026-03-13",
     "every day at 18:00 between 2026-03-12 and 2026-03-12 except 2026-03-12",
-]
+)
 
-@pytest.fixture(autouse=True)
-def _freeze_now(monkeypatch: pytest.MonkeyPatch) -> None:
-    class FixedDateTime(datetime):
-        @classmethod
-        def now(cls, tz=None):
-            return NOW
+class FixedDateTime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
 
-    monkeypatch.setattr(engine, "datetime", FixedDateTime)
 
+# Patched once for the whole module; no test touches engine.datetime itself.
+@pytest.fixture(scope="module", autouse=True)
+def _freeze_now() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(engine, "datetime", FixedDateTime)
+        yield
 
-def _assert_next_occurrence(rule: str, expected_prefix: str, now: datetime = NOW, tz: str = TZ) -> None:
+
+def _assert_next_occurrence(rule: str, expected: str, now: datetime = NOW, tzinfo: ZoneInfo = TZINFO) -> None:
     validate(rule)
     got = next_occurrence(rule)
-    got_local = got.astimezone(ZoneInfo(tz)).replace(tzinfo=None).isoformat()
-    assert got_local.startswith(expected_prefix), (
-        f"\nRule: {rule}\nNow:  {now.isoformat()}\nGot:  {got.isoformat()} (local={got_local})\nExp:  {expected_prefix}..."
+    got_local = got.astimezone(tzinfo).replace(tzinfo=None)
+    assert got_local == datetime.fromisoformat(expected), (
+        f"\nRule: {rule}\nNow:  {now.isoformat()}\nGot:  {got.isoformat()} (local={got_local.isoformat()})\nExp:  {expected}"
     )
 
 
-@pytest.mark.parametrize("rule, expected_prefix", CASES_EN, ids=[case[0] for case in CASES_EN])
-def test_next_occurrence_rule_en(rule: str, expected_prefix: str) -> None:
+@pytest.mark.lang_en
+@pytest.mark.parametrize("rule, expected", CASES_EN, ids=RULES_EN)
+def test_next_occurrence_rule_en(rule: str, expected: str) -> None:
     """
     Fixed reference date: 2026-03-12 12:00 in Europe/Paris
     """
-    _assert_next_occurrence(rule, expected_prefix)
+    _assert_next_occurrence(rule, expected)
+
+
+@pytest.mark.parametrize("rules", [RULES_EN, RULES_FR], ids=["en", "fr"])
+def test_case_rules_are_unique(rules: Tuple[str, ...]) -> None:
+    duplicates = sorted({rule for rule in rules if rules.count(rule) > 1})
+    assert not duplicates, f"Duplicated cases: {duplicates}"
 
 
 @pytest.mark.parametrize("rule", INVALID_RULES, ids=INVALID_RULES)
@@ -398,6 +426,63 @@ def test_next_occurrence_invalid_rule(rule: str) -> None:
         validate(rule)
 
 
-@pytest.mark.parametrize("rule, expected_prefix", CASES_FR, ids=[case[0] for case in CASES_FR])
-def test_next_occurrence_rule_fr(rule: str, expected_prefix: str) -> None:
-    _assert_next_occurrence(rule, expected_prefix)
+@pytest.mark.lang_fr
+@pytest.mark.parametrize("rule, expected", CASES_FR, ids=RULES_FR)
+def test_next_occurrence_rule_fr(rule: str, expected: str) -> None:
+    _assert_next_occurrence(rule, expected)
+
+
+@pytest.mark.parametrize("rule_en, rule_fr", PAIRED, ids=[pair[0] for pair in PAIRED])
+def test_en_fr_equivalent(rule_en: str, rule_fr: str) -> None:
+    assert next_occurrence(rule_fr) == next_occurrence(rule_en)
+
+
+def test_precompiled_rules_skip_parsing(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    rules = ["every weekday at 09:00", "tous les jours à 18h00"]
+    path = str(tmp_path / "rules.pkl")
+    engine.precompile(rules, path)
+
+    monkeypatch.setattr(engine, "_precompiled", {})
+    assert engine.load_precompiled(path) == len(rules)
+
+    def _no_parse(*args, **kwargs):
+        raise AssertionError("precompiled rule was parsed again")
+
+    monkeypatch.setattr(engine, "_parse_schedule_cached", _no_parse)
+    assert next_occurrence(rules[0]).isoformat().startswith("2026-03-13T09:00:00")
+    assert next_occurrence(rules[1]).isoformat().startswith("2026-03-12T18:00:00")
+
+
+def test_excluded_day_skipped_in_now_timezone() -> None:
+    # Occurrences follow now's wall clock; the excluded day is skipped in it too.
+    now = datetime(2026, 3, 14, 9, 29, tzinfo=ZoneInfo("America/New_York"))
+    got = next_occurrence("every day at 10:00 and 22:00 except saturday", now=now)
+    assert got.isoformat() == "2026-03-15T10:00:00-04:00"
+
+
+def test_nth_weekday_anchor_in_now_timezone() -> None:
+    # Still May in New York but already June in Paris: May's last sunday is next.
+    now = datetime(2026, 5, 31, 18, tzinfo=ZoneInfo("America/New_York"))
+    got = next_occurrence("every month on the last sunday at 23:30", now=now)
+    assert got.isoformat() == "2026-05-31T23:30:00-04:00"
+
+
+def test_step_slots_follow_wall_clock_on_fall_back_day() -> None:
+    # 03:00:30 after the clocks go back: the 04:00 slot of the same day is next.
+    now = datetime(2026, 10, 25, 2, 0, 30, tzinfo=ZoneInfo("UTC")).astimezone(TZINFO)
+    got = next_occurrence("every day every 2 hours between 00:00 and 05:00", now=now)
+    assert got.isoformat() == "2026-10-25T04:00:00+01:00"
+
+
+def test_daily_slot_in_repeated_hour_after_fold_now() -> None:
+    # 02:10 in the second pass of the repeated hour: 02:30+01:00 is still ahead.
+    now = datetime(2026, 10, 25, 2, 10, tzinfo=TZINFO, fold=1)
+    got = next_occurrence("every day at 02:30", now=now)
+    assert got.isoformat() == "2026-10-25T02:30:00+01:00"
+
+
+def test_multi_time_slot_in_repeated_hour_after_fold_now() -> None:
+    # A full hours x minutes grid, expanded by a single rrule.
+    now = datetime(2026, 10, 25, 2, 10, tzinfo=TZINFO, fold=1)
+    got = next_occurrence("every day at 02:30 and 03:30", now=now)
+    assert got.isoformat() == "2026-10-25T02:30:00+01:00"
@@ -0,0 +1,32 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from recpyx import next_occurrence
+
+pytest.importorskip("pytest_benchmark")
+
+TZ = "Europe/Paris"
+NOW = datetime(2026, 3, 12, 12, 0, 0, tzinfo=ZoneInfo(TZ))
+
+# Hot-path shapes from the engine cases: nth weekday, excepts, steps and windows.
+BENCH_RULES = [
+    "every day at 10:00",
+    "every monday and thursday at 18:00",
+    "every day at 11:00, 12:30, 23:00",
+    "every day every 30 minutes between 12:00 and 14:00 except thursday",
+    "every 4 hours between 01:00 and 23:00 except thursday",
+    "every month on the first monday at 09:00 except 2026-04-06",
+    "every month on the last monday at 07:15",
+    "every month on the 31st at 20:00 except 2026-03-31 and 2026-05-31",
+    "every year on the last sunday of october at 23:00",
+    "every weekday at 09:00 between 2026-03-12 and 2026-03-16 except friday",
+    "tous les jours ouvrés à 09h00 sauf le vendredi",
+]
+
+
+@pytest.mark.benchmark(group="engine")
+@pytest.mark.parametrize("rule", BENCH_RULES, ids=BENCH_RULES)
+def test_bench_next_occurrence(benchmark, rule: str) -> None:
+    benchmark(next_occurrence, rule, now=NOW, default_tz=TZ)
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from dateutil.rrule import DAILY, HOURLY, MINUTELY, SU, WEEKLY, rrule
+
+PARIS = ZoneInfo("Europe/Paris")
+
+
+def test_hourly_after_target_in_other_zone_across_dst() -> None:
+    # 08:30 UTC is 10:30 in Paris once summer time started: 12:00 is next.
+    rule = rrule(freq=HOURLY, interval=2, dtstart=datetime(2026, 3, 1, 10, tzinfo=PARIS))
+    got = rule.after(datetime(2026, 4, 1, 8, 30, tzinfo=timezone.utc))
+    assert got.isoformat() == "2026-04-01T12:00:00+02:00"
+
+
+def test_daily_after_target_in_other_zone_across_dst() -> None:
+    # 08:30 UTC is 10:30 in Paris once summer time started: today's 10:00 is past.
+    rule = rrule(freq=DAILY, dtstart=datetime(2026, 3, 1, 10, tzinfo=PARIS))
+    got = rule.after(datetime(2026, 4, 1, 8, 30, tzinfo=timezone.utc))
+    assert got.isoformat() == "2026-04-02T10:00:00+02:00"
+
+
+def test_daily_times_after_target_in_other_zone_across_dst() -> None:
+    rule = rrule(freq=DAILY, dtstart=datetime(2026, 3, 1, tzinfo=PARIS), byhour=[10, 18], byminute=0)
+    got = rule.after(datetime(2026, 4, 1, 8, 30, tzinfo=timezone.utc))
+    assert got.isoformat() == "2026-04-01T18:00:00+02:00"
+
+
+def test_minutely_after_fold_target_stays_ahead() -> None:
+    rule = rrule(freq=MINUTELY, interval=15, dtstart=datetime(2026, 10, 25, tzinfo=PARIS))
+    got = rule.after(datetime(2026, 10, 25, 2, 10, tzinfo=PARIS, fold=1))
+    assert got.isoformat() == "2026-10-25T02:15:00+01:00"
+
+
+def test_daily_times_after_fold_target_stays_ahead() -> None:
+    rule = rrule(freq=DAILY, dtstart=datetime(2026, 10, 1, tzinfo=PARIS), byhour=[2, 3], byminute=30)
+    got = rule.after(datetime(2026, 10, 25, 2, 10, tzinfo=PARIS, fold=1))
+    assert got.isoformat() == "2026-10-25T02:30:00+01:00"
+
+
+def test_weekly_after_fold_target_stays_ahead() -> None:
+    rule = rrule(freq=WEEKLY, dtstart=datetime(2026, 10, 4, tzinfo=PARIS), byweekday=[SU], byhour=2, byminute=30)
+    got = rule.after(datetime(2026, 10, 25, 2, 10, tzinfo=PARIS, fold=1))
+    assert got.isoformat() == "2026-10-25T02:30:00+01:00"